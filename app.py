@@ -1,11 +1,21 @@
 import asyncio
+import hashlib
 import json
+import logging
 import os
-from typing import Dict, Any
+import queue
+import secrets
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Literal, Optional, Union
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+import httpx
+import orjson
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, ConfigDict
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
@@ -14,71 +24,311 @@ from level_core.simluators.schemas import BasicConversation, ConversationBatch
 from level_core.simluators.service import ConversationSimulator
 from level_core.evaluators.service import EvaluationService
 from level_core.evaluators.schemas import EvaluationConfig
+from level_core.evaluators.base import aclose_http_client as aclose_evaluator_http_client
+from level_core.datastore.registry import get_datastore
+from config.loader import get_database_config
 
 # Load environment variables
 load_dotenv()
 
+LOG_LEVEL = os.getenv("LOG_LEVEL", "info").lower()
+logger = logging.getLogger("levelapp")
+
 # Global services
 evaluation_service = None
 
+# Headers shared by every request sent to the evaluated endpoint
+BASE_HEADERS = {"Content-Type": "application/json"}
+
+# Responses with more scenarios than this are streamed instead of encoded in one piece
+STREAMING_SCENARIOS_THRESHOLD = int(os.getenv("STREAMING_SCENARIOS_THRESHOLD", "50"))
+
+# In-memory cache of evaluation results, keyed by a hash of the evaluation inputs
+RESULTS_CACHE_SIZE = int(os.getenv("RESULTS_CACHE_SIZE", "256"))
+_results_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+# Evaluations currently running, so identical concurrent requests share one run
+_inflight_evaluations: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def _read_rate_limit(name: str) -> Optional[float]:
+    """Positive float from env var `name`; unset or invalid values are logged and ignored."""
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        limit = float(value)
+    except ValueError:
+        logger.warning(f"Ignoring {name}={value!r}: not a number")
+        return None
+    if limit <= 0:
+        logger.warning(f"Ignoring {name}={value!r}: must be positive")
+        return None
+    return limit
+
+
+def start_queued_logging() -> Callable[[], None]:
+    """
+    Route root logging through a queue; a listener thread does the actual stdout I/O.
+
+    Returns:
+        Callable[[], None]: Stops the listener (flushing queued records) and detaches the handler.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream_handler)
+    queue_handler = QueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(LOG_LEVEL.upper())
+    root_logger.addHandler(queue_handler)
+    listener.start()
+
+    def stop() -> None:
+        root_logger.removeHandler(queue_handler)
+        listener.stop()
+
+    return stop
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize evaluation service on startup"""
     global evaluation_service
+
+    # Logging is configured here rather than at import, so importing the module has no side effects
+    stop_queued_logging = start_queued_logging()
     
     try:
-        print("Starting LevelApp API initialization...")
+        logger.info("Starting LevelApp API initialization...")
         
+        # Shared HTTP client so endpoint calls reuse pooled (HTTP/2) connections
+        app.state.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=900,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        )
+
+        # Build the Firestore client once and share it across requests
+        app.state.firestore_service = None
+        try:
+            db_config = get_database_config("config.yaml")
+            app.state.firestore_service = get_datastore(backend="firestore", config=db_config)
+            logger.info("Firestore service initialized")
+        except Exception as e:
+            logger.warning(f"Firestore unavailable, results will not be persisted: {e}")
+
         # Initialize evaluation service
         evaluation_service = EvaluationService(logger=Logger("EvaluationService"))
-        print("Evaluation service initialized")
+        logger.info("Evaluation service initialized")
+
+        # Optional per-provider rate limits, e.g. OPENAI_RPM=500 / OPENAI_TPM=200000
+        for provider in evaluation_service.configs:
+            rpm = _read_rate_limit(f"{provider.upper()}_RPM")
+            tpm = _read_rate_limit(f"{provider.upper()}_TPM")
+            if rpm or tpm:
+                evaluation_service.set_rate_limit(provider, requests_per_minute=rpm, tokens_per_minute=tpm)
         
         # Set up default configurations if environment variables are available
 
-        print("LevelApp API started successfully")
+        logger.info("LevelApp API started successfully")
         
     except Exception as e:
-        print(f"Error during startup: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"Error during startup: {e}", exc_info=True)
     
     yield
-    print("LevelApp API shutting down...")
+    logger.info("LevelApp API shutting down...")
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+    await aclose_evaluator_http_client()
+    firestore_service = getattr(app.state, "firestore_service", None)
+    if firestore_service is not None:
+        firestore_service.close()
+    stop_queued_logging()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="LevelApp API",
     description="Minimal API for conversation evaluation",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 from fastapi.middleware.cors import CORSMiddleware
 
-origins = os.getenv("ALLOWED_ORIGINS", "").split(",")
+# Comma-separated list; blank entries are dropped so an unset variable yields no origins
+origins = [origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "").split(",") if origin.strip()]
+
+if origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+
+def save_results_to_firestore(firestore_service, user_id: str, project_id: str, batch_id: str, data: Dict[str, Any]):
+    """Persist evaluation results; runs as a background task after the response is sent."""
+    try:
+        firestore_service.save_batch_test_results(
+            user_id=user_id,
+            project_id=project_id,
+            batch_id=batch_id,
+            data=data,
+        )
+        logger.info(f"Results saved to Firestore for project: {project_id}")
+    except Exception as e:
+        logger.error(f"Failed to save to Firestore: {e}", exc_info=True)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 # Main evaluation request schema
 class MainEvaluationRequest(BaseModel):
     """Main evaluation request that mimics main.py behavior"""
     model_config = ConfigDict(protected_namespaces=())
     
-    test_batch: Dict[str, Any] = Field(description="The test batch data from batch_test.json format")
+    test_batch: Union[BasicConversation, List[BasicConversation]] = Field(
+        description="One conversation or a list of conversations in batch_test.json format"
+    )
     endpoint: str = Field(default="http://localhost:8000", description="LLM endpoint to test against")
     model_id: str = Field(default="meta-llama/Llama-3.3-70B-Instruct", description="Model ID for headers")
     attempts: int = Field(default=1, description="Number of test attempts")
     test_name: str = Field(default="api_test", description="Name for the test run")
+    max_concurrency: Optional[int] = Field(default=None, ge=1, description="Maximum number of conversations simulated at once")
+    cache_mode: Literal["enabled", "replay", "disabled"] = Field(
+        default="disabled",
+        description="enabled: reuse and store cached results; replay: only serve cached results (404 on miss); disabled: always run"
+    )
     user_id: str
     project_id: str
 
 
+def conversations_of(request: MainEvaluationRequest) -> List[BasicConversation]:
+    """Normalize `test_batch` to a list of conversations."""
+    return request.test_batch if isinstance(request.test_batch, list) else [request.test_batch]
+
+
+def evaluation_cache_key(request: MainEvaluationRequest) -> str:
+    """Deterministic SHA-256 key over the inputs that determine an evaluation's results."""
+    payload = {
+        "batch": [
+            conversation.model_dump(mode="json", exclude_unset=True)
+            for conversation in conversations_of(request)
+        ],
+        "model": request.model_id,
+        "endpoint": request.endpoint,
+        "attempts": request.attempts,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def get_cached_results(key: str):
+    """Return cached results for `key` (marking them recently used), or None."""
+    results = _results_cache.get(key)
+    if results is not None:
+        _results_cache.move_to_end(key)
+    return results
+
+
+def store_cached_results(key: str, results: Dict[str, Any]):
+    """Store results for `key`, evicting the least recently used entry when full."""
+    _results_cache[key] = results
+    _results_cache.move_to_end(key)
+    while len(_results_cache) > RESULTS_CACHE_SIZE:
+        _results_cache.popitem(last=False)
+
+
+def _orjson_default(obj: Any):
+    """Serialize the non-primitive values orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_jsonable(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a results tree (models, UUIDs, datetimes, numpy values) to plain JSON types."""
+    return orjson.loads(
+        orjson.dumps(
+            results,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    )
+
+
+async def stream_evaluation_response(header: Dict[str, Any], results: Dict[str, Any]):
+    """Yield the /evaluate JSON body incrementally, encoding one scenario at a time."""
+    summary = {key: value for key, value in results.items() if key != "scenarios"}
+    summary_json = orjson.dumps(summary)[:-1] + (b"," if summary else b"")
+    yield orjson.dumps(header)[:-1] + b',"results":' + summary_json + b'"scenarios":['
+    for index, scenario in enumerate(results.get("scenarios", [])):
+        if index:
+            yield b","
+        yield orjson.dumps(scenario)
+    yield b"]}}"
+
+
+async def run_evaluation(
+    request: MainEvaluationRequest,
+    conversations: List[BasicConversation],
+    client: httpx.AsyncClient,
+) -> Dict[str, Any]:
+    """Simulate and evaluate the conversations, returning JSON-serializable results."""
+    # Create conversations batch; the simulator runs its conversations concurrently
+    # (conversations are already validated, so skip re-validation)
+    conversations_batch = ConversationBatch.model_construct(conversations=conversations)
+
+    # Set up simulator (mimicking main.py)
+    simulator = ConversationSimulator(conversations_batch, evaluation_service)
+
+    # Setup simulator with endpoint and headers
+    headers = {**BASE_HEADERS, "x-model-id": request.model_id}
+
+    simulator.setup_simulator(
+        endpoint=request.endpoint,
+        headers=headers,
+        client=client,
+        max_concurrency=request.max_concurrency,
+    )
+
+    # Run the batch test (this is the main work)
+    results = await simulator.run_batch_test(
+        name=request.test_name,
+        test_load={},
+        attempts=request.attempts,
+    )
+    # Convert results to JSON-serializable format with orjson (native UUID/datetime/numpy
+    # support), in a worker thread so large result trees don't block the event loop
+    return await asyncio.to_thread(to_jsonable, results)
+
+
+async def run_evaluation_once(
+    key: str,
+    request: MainEvaluationRequest,
+    conversations: List[BasicConversation],
+    client: httpx.AsyncClient,
+) -> Dict[str, Any]:
+    """
+    Run the evaluation for `key`, sharing one in-flight run between concurrent identical requests.
+
+    The run is shielded so a disconnecting client does not cancel it for the others;
+    its results are stored in the results cache.
+    """
+    task = _inflight_evaluations.get(key)
+    if task is None:
+        task = asyncio.create_task(run_evaluation(request, conversations, client))
+        _inflight_evaluations[key] = task
+        task.add_done_callback(lambda _: _inflight_evaluations.pop(key, None))
+    results = await asyncio.shield(task)
+    store_cached_results(key, results)
+    return results
+
+
 @app.post("/evaluate", tags=["Main"])
-async def main_evaluate(request: MainEvaluationRequest):
+async def main_evaluate(request: MainEvaluationRequest, http_request: Request, background_tasks: BackgroundTasks):
     """
     End point to evaluate a conversation batch against an LLM endpoint.
     """
@@ -90,41 +340,30 @@ async def main_evaluate(request: MainEvaluationRequest):
                 detail="Evaluation service not initialized. Server may need restart."
             )
         
-        # Validate and create BasicConversation from test_batch
-        try:
-            batch_test = BasicConversation.model_validate(request.test_batch)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid test_batch format: {str(e)}"
-            )
-        
-        # Create conversations batch
-        conversations_batch = ConversationBatch(conversations=[batch_test])
-        
-        # Set up simulator (mimicking main.py)
-        simulator = ConversationSimulator(conversations_batch, evaluation_service)
-        
-        # Setup simulator with endpoint and headers
-        headers = {
-            "Content-Type": "application/json",
-            "x-model-id": request.model_id
-        }
-        
-        simulator.setup_simulator(
-            endpoint=request.endpoint,
-            headers=headers
-        )
-        
-        # Run the batch test (this is the main work)
-        results = await simulator.run_batch_test(
-            name=request.test_name,
-            test_load={},
-            attempts=request.attempts,
-        )
-        # Convert results to JSON-serializable format using FastAPI encoder
-        from fastapi.encoders import jsonable_encoder
-        serializable_results = jsonable_encoder(results)
+        # test_batch is validated into BasicConversation(s) when the request is parsed
+        conversations = conversations_of(request)
+
+        # The key hashes the whole request, so it is only computed when the cache is in use
+        cache_key = None
+        serializable_results = None
+        if request.cache_mode != "disabled":
+            cache_key = evaluation_cache_key(request)
+            serializable_results = get_cached_results(cache_key)
+            if serializable_results is None and request.cache_mode == "replay":
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="No cached results for this evaluation (cache_mode=replay)"
+                )
+
+        if serializable_results is None:
+            if request.cache_mode == "enabled":
+                serializable_results = await run_evaluation_once(
+                    cache_key, request, conversations, http_request.app.state.http_client
+                )
+            else:
+                serializable_results = await run_evaluation(
+                    request, conversations, http_request.app.state.http_client
+                )
 
         enriched_results = {
             **serializable_results,
@@ -132,37 +371,38 @@ async def main_evaluate(request: MainEvaluationRequest):
             "modelId": request.model_id,
             "attempts": request.attempts,
         }
-        print(f"DEBUG: Enriched results: {json.dumps(enriched_results, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Enriched results: {orjson.dumps(enriched_results, option=orjson.OPT_INDENT_2).decode()}")
 
-        # Save to Firestore if configuration is available
-        try:
-            from level_core.datastore.registry import get_datastore
-            from config.loader import get_database_config
-            import uuid
-
-            db_config = get_database_config("config.yaml")
-            firestore_service = get_datastore(backend="firestore", config=db_config)
-            firestore_service.save_batch_test_results(
+        # Save to Firestore after the response is sent, if configuration is available
+        firestore_service = http_request.app.state.firestore_service
+        if firestore_service is not None:
+            background_tasks.add_task(
+                save_results_to_firestore,
+                firestore_service,
                 user_id=request.user_id,
                 project_id=request.project_id,
-                batch_id=f"batch-{uuid.uuid4()}",
+                batch_id=f"batch-{secrets.token_hex(16)}",
                 data=enriched_results,
             )
-            print(f"Results saved to Firestore for project: {request.project_id}")
-        except Exception as e:
-            print(f"Failed to save to Firestore: {e}")
-            # Continue without failing the entire evaluation
 
-        return JSONResponse(
+        response_header = {
+            "message": "Evaluation completed successfully",
+            "test_name": request.test_name,
+            "endpoint": request.endpoint,
+            "model_id": request.model_id,
+            "attempts": request.attempts,
+        }
+        if len(serializable_results.get("scenarios", [])) > STREAMING_SCENARIOS_THRESHOLD:
+            return StreamingResponse(
+                stream_evaluation_response(response_header, serializable_results),
+                status_code=status.HTTP_200_OK,
+                media_type="application/json",
+            )
+
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
-            content={
-                "message": "Evaluation completed successfully",
-                "test_name": request.test_name,
-                "endpoint": request.endpoint,
-                "model_id": request.model_id,
-                "attempts": request.attempts,
-                "results": serializable_results,
-            },
+            content={**response_header, "results": serializable_results},
         )
 
 
@@ -176,15 +416,23 @@ async def main_evaluate(request: MainEvaluationRequest):
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
-    
+
+    dev_mode = os.getenv("DEV") == "1"
+
     # Run the server
     uvicorn.run(
-        "app:app", 
-        host="0.0.0.0", 
-        port=8080, 
-        reload=True,
-        log_level="info"
+        "app:app",
+        host="0.0.0.0",
+        port=8080,
+        # uvloop is not installed on Windows; let uvicorn pick the default loop there
+        loop="uvloop" if importlib.util.find_spec("uvloop") is not None else "auto",
+        http="httptools",
+        reload=dev_mode,
+        # RAG sessions live in process memory, so scale out workers only when that is acceptable
+        workers=None if dev_mode else int(os.getenv("WORKERS", "1")),
+        log_level=LOG_LEVEL
     )
 
 # Add to existing imports
@@ -1,10 +1,20 @@
 import yaml
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed loader
+except ImportError:
+    from yaml import SafeLoader
+
+@lru_cache(maxsize=8)
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
     Load configuration from YAML file.
+
+    The parsed configuration is cached per path for the lifetime of the process;
+    callers must treat the returned dictionary as read-only.
     
     Args:
         config_path (str): Path to the configuration file
@@ -16,7 +26,7 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
     with open(config_path, 'r') as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=SafeLoader)
     
     return config
 
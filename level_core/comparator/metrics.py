@@ -2,6 +2,8 @@
 import numpy as np
 
 from collections import namedtuple
+from functools import lru_cache
+from itertools import repeat
 from typing import List, Tuple, Callable, cast, Protocol, Optional, Dict
 
 from rapidfuzz import distance, process, utils, fuzz
@@ -19,6 +21,27 @@ ComparisonResults = namedtuple(
 )
 
 
+@lru_cache(maxsize=256)
+def _default_metrics_config(field: str) -> MetricConfig:
+    """Build (once per field) the template metrics configuration used when a field has no mapping."""
+    return MetricConfig(
+        field_name=field,
+        entity_metric=EntityMetric.LEV_NORM,
+        set_metric=SetMetric.ACCURACY,
+        threshold=0.9
+    )
+
+
+def _pad_sequences(reference_seq: List[str], extracted_seq: List[str]) -> Tuple[List[str], List[str]]:
+    """Pad only the shorter sequence with empty strings; equal-length sequences are returned as-is."""
+    length_diff = len(reference_seq) - len(extracted_seq)
+    if length_diff > 0:
+        return reference_seq, [*extracted_seq, *repeat("", length_diff)]
+    if length_diff < 0:
+        return [*reference_seq, *repeat("", -length_diff)], extracted_seq
+    return reference_seq, extracted_seq
+
+
 class Scorer(Protocol):
     def __call__(self, ref: str, ext: str) -> float:
         ...
@@ -27,36 +50,22 @@ class Scorer(Protocol):
 class MetricsManager:
     """Manages scorer registration, score computation, metric configuration."""
 
+    # Built-in scorers, built once at import; instances start from a copy
+    _DEFAULT_SCORERS: Dict[str, Callable] = {
+        EntityMetric.LEV_NORM.value: distance.Levenshtein.normalized_similarity,
+        EntityMetric.JARO_WINKLER.value: distance.JaroWinkler.normalized_similarity,
+        EntityMetric.TOKEN_SET_RATIO.value: fuzz.token_set_ratio,
+        EntityMetric.WRATIO.value: fuzz.WRatio,
+    }
+
     def __init__(self, metrics_mapping: Optional[Dict[str, MetricConfig]] = None):
         self._scorers: Dict[str, Callable] = {}
         self.metrics_mapping = metrics_mapping or {}
         self._initialize_scorers()
 
     def _initialize_scorers(self) -> None:
-        """Register existing scorers to prevent residual state."""
-        self._scorers.clear()
-
-        self.register_scorer(
-            EntityMetric.LEV_NORM.value,
-            distance.Levenshtein.normalized_similarity
-        )
-        self.register_scorer(
-            EntityMetric.JARO_WINKLER.value,
-            distance.JaroWinkler.normalized_similarity,
-        )
-        self.register_scorer(
-            EntityMetric.TOKEN_SET_RATIO.value,
-            fuzz.token_set_ratio,
-        )
-        self.register_scorer(
-            EntityMetric.TOKEN_SET_RATIO.value,
-            fuzz.token_set_ratio,
-        )
-
-        self.register_scorer(
-            EntityMetric.WRATIO.value,
-            fuzz.WRatio
-        )
+        """Reset to the built-in scorers to prevent residual state."""
+        self._scorers = dict(self._DEFAULT_SCORERS)
 
     def register_scorer(self, name: str, scorer: Callable) -> None:
         """
@@ -73,7 +82,7 @@ class MetricsManager:
             raise ValueError(f"[register_scorer] Scorer for '{name}' is not callable: {type(scorer)}")
 
         self._scorers[name] = scorer
-        logging.info(f"[register_scorer] Registered scorer: {name}")
+        logging.debug(f"[register_scorer] Registered scorer: {name}")
 
     def get_scorer(self, name: str) -> Callable:
         """
@@ -91,7 +100,7 @@ class MetricsManager:
         # TODO: Add a default value for fallback.
         try:
             scorer = self._scorers.get(name)
-            logging.info(f"[get_scorer] Retrieved scorer: {name}")
+            logging.debug(f"[get_scorer] Retrieved scorer: {name}")
             return scorer
 
         except KeyError:
@@ -107,13 +116,11 @@ class MetricsManager:
         Returns:
             MetricConfig: metrics configuration for the given field.
         """
-        default_config = MetricConfig(
-            field_name=field,
-            entity_metric=EntityMetric.LEV_NORM,
-            set_metric=SetMetric.ACCURACY,
-            threshold=0.9
-        )
-        return self.metrics_mapping.get(field, default_config)
+        config = self.metrics_mapping.get(field)
+        if config is not None:
+            return config
+        # Callers get their own copy so changing it cannot leak into the cached template
+        return _default_metrics_config(field).model_copy()
 
     def compute_entity_scores(
             self,
@@ -148,51 +155,149 @@ class MetricsManager:
             logging.warning(f"[compute_entity_scores] Scorer name <{scorer}> is not supported.]")
             raise ValueError(f"[compute_entity_scores] Scorer <{scorer}> is not registered.")
 
-        max_len = max(len(reference_seq), len(extracted_seq))
-        reference_padded = reference_seq + [""] * (max_len - len(reference_seq))
-        extracted_padded = extracted_seq + [""] * (max_len - len(extracted_seq))
+        if not pairwise:
+            return self.compute_best_match_scores(sequence_pairs=[(reference_seq, extracted_seq)], scorer=scorer)[0]
 
+        reference_padded, extracted_padded = _pad_sequences(reference_seq, extracted_seq)
         scorer_func = cast(Callable, self.get_scorer(name=scorer.value))
 
-        if pairwise:
-            scores_ = process.cpdist(
-                queries=reference_padded,
-                choices=extracted_padded,
-                scorer=scorer_func,
-                processor=utils.default_process,
-                workers=-1,
-            )
-            scores = scores_.flatten()
-            res = [
-                ComputedScores(
-                    ref=reference_padded[i],
-                    ext=extracted_padded[i],
-                    e_metric=scorer.value,
-                    e_score=scores[i]
-                ) for i in range(len(scores))
-            ]
+        # cpdist scores element-wise pairs only (no cross-product matrix)
+        scores = process.cpdist(
+            queries=reference_padded,
+            choices=extracted_padded,
+            scorer=scorer_func,
+            processor=utils.default_process,
+            workers=-1,
+        )
 
-        else:
-            scores_ = process.cdist(
-                queries=reference_padded,
-                choices=extracted_padded,
-                scorer=scorer_func,
-                processor=utils.default_process,
-                workers=-1,
-            )
-            scores = np.max(scores_, axis=1)
-            max_idx = np.argmax(scores_, axis=1)
-            res = [
-                ComputedScores(
-                    ref=reference_padded[i],
-                    ext=extracted_padded[max_idx[i]],
-                    e_metric=scorer.value,
-                    e_score=scores[i]
-                ) for i in range(len(scores))
-            ]
+        res = list(map(
+            ComputedScores._make,
+            zip(reference_padded, extracted_padded, repeat(scorer.value), scores.tolist()),
+        ))
 
         return res
 
+    def compute_best_match_scores(
+            self,
+            sequence_pairs: List[Tuple[List[str], List[str]]],
+            scorer: EntityMetric = EntityMetric.LEV_NORM,
+    ) -> List[List[ComputedScores]]:
+        """
+        Match each reference entity to its best-scoring extracted entity, for many sequence pairs at once.
+
+        The value combinations of every pair are concatenated and scored in a single RapidFuzz
+        cpdist call, so a whole group of fields costs one (parallel) kernel call instead of one
+        cdist call per field. Only combinations within a pair are scored, never across pairs.
+
+        Args:
+            sequence_pairs (List[Tuple[List[str], List[str]]]): (reference, extracted) sequences.
+            scorer (EntityMetric): Name of the scorer to use.
+
+        Returns:
+            List[List[ComputedScores]]: Per pair, one (reference, best extracted, metric, score) tuple
+            per (padded) reference entity, in input order.
+        """
+        if scorer not in EntityMetric.list():
+            logging.warning(f"[compute_best_match_scores] Scorer name <{scorer}> is not supported.]")
+            raise ValueError(f"[compute_best_match_scores] Scorer <{scorer}> is not registered.")
+
+        scorer_func = cast(Callable, self.get_scorer(name=scorer.value))
+        # Values are processed once here rather than once per scored combination inside cpdist
+        processed: Dict[str, str] = {}
+
+        # Per pair: (padded reference, distinct reference values, distinct extracted values,
+        # offset of the pair's scores in the concatenated batch), or None for an empty side
+        blocks: List[Optional[Tuple[List[str], List[str], List[str], int]]] = []
+        queries: List[str] = []
+        choices: List[str] = []
+        for reference_seq, extracted_seq in sequence_pairs:
+            if not reference_seq or not extracted_seq:
+                blocks.append(None)
+                continue
+
+            reference_padded, extracted_padded = _pad_sequences(reference_seq, extracted_seq)
+            # Score distinct values only (first-occurrence order keeps argmax tie-breaking);
+            # duplicates share the row of their first occurrence
+            reference_unique = list(dict.fromkeys(reference_padded))
+            extracted_unique = list(dict.fromkeys(extracted_padded))
+            for value in (*reference_unique, *extracted_unique):
+                if value not in processed:
+                    processed[value] = utils.default_process(value)
+
+            blocks.append((reference_padded, reference_unique, extracted_unique, len(queries)))
+            extracted_processed = [processed[value] for value in extracted_unique]
+            for value in reference_unique:
+                queries.extend(repeat(processed[value], len(extracted_unique)))
+                choices.extend(extracted_processed)
+
+        all_scores = process.cpdist(
+            queries=queries,
+            choices=choices,
+            scorer=scorer_func,
+            workers=-1,
+        ) if queries else None
+
+        results = []
+        for (reference_seq, extracted_seq), block in zip(sequence_pairs, blocks):
+            if block is None:
+                results.append([
+                    ComputedScores(
+                        ref=reference_seq,
+                        ext=extracted_seq,
+                        e_metric=scorer.value,
+                        e_score=np.nan,
+                    )
+                ])
+                continue
+
+            reference_padded, reference_unique, extracted_unique, offset = block
+            size = len(reference_unique) * len(extracted_unique)
+            scores_ = all_scores[offset:offset + size].reshape(len(reference_unique), len(extracted_unique))
+            max_idx = scores_.argmax(axis=1)
+            best_scores = np.take_along_axis(scores_, max_idx[:, None], axis=1).ravel()
+
+            row_of = {value: row for row, value in enumerate(reference_unique)}
+            rows = [row_of[value] for value in reference_padded]
+            scores = best_scores[rows]
+            matched_ext = [extracted_unique[max_idx[row]] for row in rows]
+
+            results.append(list(map(
+                ComputedScores._make,
+                zip(reference_padded, matched_ext, repeat(scorer.value), scores.tolist()),
+            )))
+
+        return results
+
+    def compute_identical_scores(
+            self,
+            sequence: List[str],
+            scorer: EntityMetric = EntityMetric.LEV_NORM,
+    ) -> List[ComputedScores]:
+        """
+        Score a sequence against an identical copy of itself (each entity's best match is itself).
+
+        Args:
+            sequence (List[str]): The reference (and extracted) sequence.
+            scorer (EntityMetric): Name of the scorer to use.
+
+        Returns:
+            List[ComputedScores]: One (entity, entity, metric, score) tuple per entity.
+        """
+        if scorer not in EntityMetric.list():
+            logging.warning(f"[compute_identical_scores] Scorer name <{scorer}> is not supported.]")
+            raise ValueError(f"[compute_identical_scores] Scorer <{scorer}> is not registered.")
+
+        scorer_func = cast(Callable, self.get_scorer(name=scorer.value))
+        # Self-similarity is the scorer's maximum, except for strings emptied by the processor
+        self_scores = {
+            value: float(scorer_func(value, value, processor=utils.default_process))
+            for value in set(sequence)
+        }
+        return [
+            ComputedScores._make((value, value, scorer.value, self_scores[value]))
+            for value in sequence
+        ]
+
     @staticmethod
     def compute_set_scores(
             data: List[ComputedScores],
@@ -218,20 +323,17 @@ class MetricsManager:
         entity_scores = np.array([_.e_score for _ in data], dtype=np.float32)
         entity_metric = data[0].e_metric
 
-        matches = np.count_nonzero(entity_scores >= threshold)
+        match_mask = entity_scores >= threshold
+        matches = int(np.count_nonzero(match_mask))
 
         if len(data) == 1:
-            entity_scores = entity_scores.tolist()
-            set_scores = np.array(
-                [1 if score >= threshold else 0 for score in entity_scores], dtype=np.float32
-            ).tolist()
             return ComparisonResults(
                 ref=ref,
                 ext=ext,
                 e_metric=entity_metric,
-                e_score=entity_scores,
+                e_score=entity_scores.tolist(),
                 s_metric=None,
-                s_score=set_scores
+                s_score=match_mask.astype(np.float32).tolist()
             )
 
         tp = matches
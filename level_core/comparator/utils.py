@@ -1,14 +1,38 @@
 """levelapp/comparator/utils.py:"""
 
-import re
 import json
 import logging
+import orjson
 import pandas as pd
 
 from typing import List, Dict, Any, Literal, Union
 from pathlib import Path
 
 
+# Non-printable control characters except \t, \n, \r are dropped; U+FFFD becomes '?'
+_JSON_TEXT_TRANSLATION = {
+    **dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]),
+    0xFFFD: ord("?"),
+}
+
+# Byte-level equivalents for the fast path in safe_load_json_file (ASCII bytes never occur
+# inside multi-byte UTF-8 sequences, so deleting them cannot split a character)
+_CONTROL_BYTES = bytes([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+_UTF8_BOM = "\ufeff".encode("utf-8")
+_UTF8_REPLACEMENT_CHAR = "\ufffd".encode("utf-8")
+
+_EVALUATION_RESULT_COLUMNS = (
+    "field_name",
+    "reference_values",
+    "extracted_values",
+    "entity_metric",
+    "entity_scores",
+    "set_metric",
+    "set_scores",
+    "threshold",
+)
+
+
 def format_evaluation_results(
     evaluation_results: List[tuple],
     output_type: Literal["json", "csv"] = "json"
@@ -27,22 +51,12 @@ def format_evaluation_results(
         logging.warning("No evaluation data to format.")
         return None
 
-    rows = [
-        {
-            "field_name": field_name,
-            "reference_values": ref_values,
-            "extracted_values": ext_values,
-            "entity_metric": e_metric,
-            "entity_scores": e_scores,
-            "set_metric": s_metric,
-            "set_scores": s_scores,
-            "threshold": threshold,
-        }
-        for (field_name, ref_values, ext_values, e_metric, e_scores, s_metric, s_scores, threshold)
-        in evaluation_results
-    ]
+    if output_type == "csv":
+        # Build column-major so pandas allocates each column once, without intermediate row dicts
+        columns = zip(*evaluation_results)
+        return pd.DataFrame(dict(zip(_EVALUATION_RESULT_COLUMNS, map(list, columns))))
 
-    return pd.DataFrame(rows) if output_type == "csv" else rows
+    return [dict(zip(_EVALUATION_RESULT_COLUMNS, result)) for result in evaluation_results]
 
 
 def store_evaluation_output(
@@ -76,8 +90,11 @@ def store_evaluation_output(
             if not isinstance(formatted_data, list):
                 raise TypeError("JSON output requires a list of dictionaries.")
             path = f"{output_path}.json"
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(formatted_data, f, indent=2, ensure_ascii=False)
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(
+                    formatted_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                ))
 
         else:
             raise ValueError(f"Unsupported file format: {file_format}")
@@ -104,6 +121,16 @@ def safe_load_json_file(file_path: Union[str, Path]) -> Any:
     with open(file_path, "rb") as f:
         raw_bytes = f.read()
 
+    # Fast path: sanitize the bytes directly and let orjson parse them without a str copy
+    if _UTF8_REPLACEMENT_CHAR not in raw_bytes:
+        sanitized_bytes = raw_bytes
+        while sanitized_bytes.startswith(_UTF8_BOM):
+            sanitized_bytes = sanitized_bytes[len(_UTF8_BOM):]
+        try:
+            return orjson.loads(sanitized_bytes.translate(None, _CONTROL_BYTES))
+        except orjson.JSONDecodeError:
+            pass  # Invalid UTF-8 or non-standard JSON (e.g. NaN): use the text path below
+
     raw_text = raw_bytes.decode("utf-8", errors="replace")
     sanitized_text = _clean_malformed_json_text(raw_text)
 
@@ -128,9 +155,6 @@ def _clean_malformed_json_text(text: str) -> str:
     text = text.lstrip('\ufeff')
 
     # Remove non-printable control characters except \t, \n, \r (please do not delete this comment)
-    text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
-
     # Remove invalid characters (like \uFFFD or strange CP1252 remnants) (please do not delete this comment)
-    text = text.replace("\ufffd", "?")
-
-    return text
+    # Both are done in a single str.translate pass over the text
+    return text.translate(_JSON_TEXT_TRANSLATION)
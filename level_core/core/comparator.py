@@ -1,8 +1,8 @@
 """'comparator/service.py':"""
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 
 from collections.abc import Mapping, Sequence
-from typing import Any, Dict, List, Tuple, Literal
+from typing import Any, Dict, List, Tuple, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -11,6 +11,65 @@ from levelapp.comparator.schemas import EntityMetric, SetMetric
 from levelapp.comparator.utils import format_evaluation_results
 
 
+# A leaf comparison: field path, stringified values, and the field's scoring configuration
+LeafJob = namedtuple(
+    typename="LeafJob",
+    field_names=["prefix", "ref", "ext", "entity_metric", "set_metric", "threshold"],
+)
+
+# Type-dispatch tables: ABC isinstance checks are resolved once per concrete type
+_LEAF, _MODEL, _SEQUENCE = "leaf", "model", "sequence"
+_VALUE_KINDS: Dict[type, str] = {
+    str: _LEAF, bytes: _LEAF, int: _LEAF, float: _LEAF, bool: _LEAF, type(None): _LEAF,
+    list: _SEQUENCE, tuple: _SEQUENCE,
+}
+_MAPPING_TYPES: Dict[type, bool] = {dict: True, defaultdict: True, list: False, str: False}
+
+
+def _value_kind(value_type: type) -> str:
+    """Classify a type for `deep_extract` (model, non-string sequence, or leaf) and cache it."""
+    if issubclass(value_type, BaseModel):
+        kind = _MODEL
+    elif issubclass(value_type, Sequence) and not issubclass(value_type, (str, bytes)):
+        kind = _SEQUENCE
+    else:
+        kind = _LEAF
+    _VALUE_KINDS[value_type] = kind
+    return kind
+
+
+def _is_mapping(value_type: type) -> bool:
+    """Return whether a type is a Mapping, caching the answer per type."""
+    is_mapping = _MAPPING_TYPES.get(value_type)
+    if is_mapping is None:
+        is_mapping = _MAPPING_TYPES[value_type] = issubclass(value_type, Mapping)
+    return is_mapping
+
+
+# Field names per pydantic model class, resolved once per class
+_MODEL_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _model_field_names(model_cls: type) -> Tuple[str, ...]:
+    """Return the (cached) field names of a pydantic model class."""
+    field_names = _MODEL_FIELD_NAMES.get(model_cls)
+    if field_names is None:
+        field_names = _MODEL_FIELD_NAMES[model_cls] = tuple(model_cls.model_fields)
+    return field_names
+
+
+def _ensure_str_list(values: List[Any]) -> List[str]:
+    """Return `values` as-is when every item is already a str, else a stringified copy."""
+    if all(type(value) is str for value in values):
+        return values
+    return [value if type(value) is str else str(value) for value in values]
+
+
+def _is_identical(reference_list: List[str], extracted_list: List[str]) -> bool:
+    """Return whether both lists hold the same values (as multisets), so no cross-scoring is needed."""
+    return len(reference_list) == len(extracted_list) and sorted(reference_list) == sorted(extracted_list)
+
+
 class MetadataComparator:
     def __init__(self, reference: BaseModel, extracted: BaseModel, metrics_manager: MetricsManager):
         self.reference = reference
@@ -19,6 +78,12 @@ class MetadataComparator:
         self._evaluation_data: List[
             Tuple[str, list[str], list[str], Any, Any, Any, Any, float]
         ] = []
+        # Per-field (entity metric, set metric, threshold), valid for `_score_cache_manager`
+        self._score_cache: Dict[str, Tuple[EntityMetric, SetMetric, float]] = {}
+        self._score_cache_manager = metrics_manager
+        # deep_extract output of the reference, valid for (reference object, indexed mode)
+        self._ref_data: Dict[str, List[str]] = {}
+        self._ref_data_key: Optional[Tuple[BaseModel, bool]] = None
 
     def _get_score(self, field: str) -> Tuple[EntityMetric, SetMetric, float]:
         """
@@ -30,8 +95,11 @@ class MetadataComparator:
         Returns:
             A tuple containing the scoring metric and its threshold.
         """
-        config = self.metrics_manager.get_metrics_config(field=field)
-        return config.entity_metric, config.set_metric, config.threshold
+        score = self._score_cache.get(field)
+        if score is None:
+            config = self.metrics_manager.get_metrics_config(field=field)
+            score = self._score_cache[field] = (config.entity_metric, config.set_metric, config.threshold)
+        return score
 
     def _format_results(
             self,
@@ -50,85 +118,14 @@ class MetadataComparator:
 
         return {i: row for i, row in enumerate(formatted_results)}
 
-    def _handle_model(
-        self, model: BaseModel, prefix: str, result: Dict[str, List[str]]
-    ) -> None:
-        """
-        Extract values from a Pydantic model recursively.
-
-        Args:
-            model: Pydantic BaseModel instance.
-            prefix: Current field path.
-            result: Dictionary to store field paths and value lists.
-        """
-        for field_name, field_info in type(model).model_fields.items():
-            field_value = getattr(model, field_name)
-            new_prefix = f"{prefix}.{field_name}" if prefix else field_name
-            self._extract_field_values(
-                value=field_value, prefix=new_prefix, result=result
-            )
-
-    def _handle_sequence(
-        self,
-        sequence: Sequence,
-        prefix: str,
-        result: Dict[str, List[str]],
-        indexed: bool = False,
-    ) -> None:
-        """
-        Extract values from a sequence (list or tuple) recursively.
-
-        Args:
-            sequence: List or tuple of values.
-            prefix: Current field path.
-            result: Dictionary to store field paths and value lists.
-            indexed: Switch parameter to select the extraction approach.
-        """
-        if not sequence:
-            result[prefix] = []
-
-        if indexed:
-            for i, item in enumerate(sequence):
-                new_prefix = f"{prefix}[{i}]" if prefix else f"[{i}]"
-                self._extract_field_values(value=item, prefix=new_prefix, result=result)
-        else:
-            for i, item in enumerate(sequence):
-                self._extract_field_values(
-                    value=item, prefix=prefix, result=result, indexed=indexed
-                )
-
-    def _extract_field_values(
-        self,
-        value: Any,
-        prefix: str,
-        result: Dict[str, List[str]],
-        indexed: bool = False,
-    ) -> None:
-        """
-        Recursively extract values from a field, storing them in result with field path as key.
-
-        Args:
-            value: The value to extract (BaseModel, dict, list, or primitive).
-            prefix: The current field path (e.g., 'documents.tribunal_members').
-            result: Dictionary to store field paths and their value lists.
-            indexed: Switch parameter to select the extraction approach.
-        """
-        if isinstance(value, BaseModel):
-            self._handle_model(model=value, prefix=prefix, result=result)
-
-        elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
-            self._handle_sequence(
-                sequence=value, prefix=prefix, result=result, indexed=indexed
-            )
-
-        else:
-            result[prefix].append(value)
-
     def deep_extract(
         self, model: BaseModel, indexed: bool = False
     ) -> Dict[str, List[str]]:
         """
-        Extracts data in a recursive way from pydantic model.
+        Extracts data from a pydantic model with an iterative depth-first walk.
+
+        Nested models contribute `parent.child` paths; sequences contribute their items under the
+        sequence's path (or `path[i]` for top-level sequences when `indexed` is set).
 
         Args:
             model: An instance of a BaseModel.
@@ -138,11 +135,39 @@ class MetadataComparator:
             A dictionary where keys are attribute names and values are lists of string values.
         """
         result: Dict[str, List[str]] = defaultdict(list)
-        for field_name, field_info in type(model).model_fields.items():
-            field_value = getattr(model, field_name)
-            self._extract_field_values(
-                value=field_value, prefix=field_name, result=result, indexed=indexed
-            )
+        # Frames are (value, prefix, indexed), pushed in reverse so values are visited in field order
+        stack = [
+            (getattr(model, field_name), field_name, indexed)
+            for field_name in reversed(_model_field_names(type(model)))
+        ]
+        while stack:
+            value, prefix, indexed_ = stack.pop()
+            kind = _VALUE_KINDS.get(type(value))
+            if kind is None:
+                kind = _value_kind(type(value))
+
+            if kind is _MODEL:
+                # Resolve the separator once per node rather than once per child
+                base = prefix + "." if prefix else ""
+                stack.extend(
+                    (getattr(value, field_name), base + field_name, False)
+                    for field_name in reversed(_model_field_names(type(value)))
+                )
+
+            elif kind is _SEQUENCE:
+                if not value:
+                    result[prefix] = []
+
+                if indexed_:
+                    stack.extend(
+                        (value[i], f"{prefix}[{i}]" if prefix else f"[{i}]", False)
+                        for i in reversed(range(len(value)))
+                    )
+                else:
+                    stack.extend((item, prefix, False) for item in reversed(value))
+
+            else:
+                result[prefix].append(value)
 
         return result
 
@@ -170,12 +195,19 @@ class MetadataComparator:
         if not (reference_list or extracted_list):
             return ComparisonResults("", "", entity_metric.value, None, set_metric.value, None)
 
-        scores = self.metrics_manager.compute_entity_scores(
-            reference_seq=reference_list,
-            extracted_seq=extracted_list,
-            scorer=entity_metric,
-            pairwise=False
-        )
+        # Exact-match fast path: identical value sets need no cross-product scoring
+        if _is_identical(reference_list, extracted_list):
+            scores = self.metrics_manager.compute_identical_scores(
+                sequence=reference_list,
+                scorer=entity_metric,
+            )
+        else:
+            scores = self.metrics_manager.compute_entity_scores(
+                reference_seq=reference_list,
+                extracted_seq=extracted_list,
+                scorer=entity_metric,
+                pairwise=False
+            )
 
         return self.metrics_manager.compute_set_scores(
             data=scores,
@@ -183,6 +215,93 @@ class MetadataComparator:
             threshold=threshold,
         )
 
+    def _collect_leaves(
+        self,
+        ref_node: Any,
+        ext_node: Any,
+        leaves: List[LeafJob],
+        prefix: str = "",
+    ) -> None:
+        """
+        Walk extracted vs. reference metadata nodes depth-first, collecting one job per leaf.
+
+        Uses an explicit stack of (ref_node, ext_node, prefix) frames instead of recursion.
+
+        Args:
+            ref_node: dict or list (from deep_extract reference metadata)
+            ext_node: dict or list (from deep_extract extracted metadata)
+            leaves: List accumulating the leaf jobs, in traversal order.
+            prefix: str, current path prefix to form hierarchical keys.
+        """
+        stack = [(ref_node, ext_node, prefix)]
+        while stack:
+            ref_node, ext_node, prefix = stack.pop()
+
+            # Case 1: Both nodes are dicts -> visit keys (pushed in reverse to keep key order)
+            if _is_mapping(type(ref_node)) and _is_mapping(type(ext_node)):
+                all_keys = list(set(ref_node.keys()) | set(ext_node.keys()))
+                base = prefix + "." if prefix else ""
+                stack.extend(
+                    (ref_node.get(key, []), ext_node.get(key, []), base + key)
+                    for key in reversed(all_keys)
+                )
+
+            # Case 2: Leaf nodes (lists) -> queue for evaluation
+            else:
+                # Defensive: convert to list if not list
+                ref_list = ref_node if isinstance(ref_node, list) else [ref_node]
+                ext_list = ext_node if isinstance(ext_node, list) else [ext_node]
+
+                # Convert all to strings for consistent fuzzy matching
+                ref_list_str = _ensure_str_list(ref_list)
+                ext_list_str = _ensure_str_list(ext_list)
+
+                entity_metric_, set_metric_, threshold = self._get_score(field=prefix)
+
+                leaves.append(
+                    LeafJob(prefix, ref_list_str, ext_list_str, entity_metric_, set_metric_, threshold)
+                )
+
+    def _evaluate_leaf(self, leaf: LeafJob) -> ComparisonResults:
+        """Evaluate similarity metrics for a single leaf job."""
+        return self.evaluate(
+            reference_list=leaf.ref,
+            extracted_list=leaf.ext,
+            entity_metric=leaf.entity_metric,
+            set_metric=leaf.set_metric,
+            threshold=leaf.threshold,
+        )
+
+    def _evaluate_leaves(self, leaves: List[LeafJob]) -> List[ComparisonResults]:
+        """
+        Evaluate similarity metrics for all leaf jobs, returned in input order.
+
+        Leaves that need cross-scoring are grouped by entity metric, and each group is scored with
+        one `compute_best_match_scores` call (a single RapidFuzz cpdist across all its value pairs).
+        Empty and identical leaves keep their cheap per-leaf paths in `evaluate`.
+        """
+        results: List[Optional[ComparisonResults]] = [None] * len(leaves)
+        groups: Dict[EntityMetric, List[int]] = defaultdict(list)
+        for i, leaf in enumerate(leaves):
+            if leaf.ref and leaf.ext and not _is_identical(leaf.ref, leaf.ext):
+                groups[leaf.entity_metric].append(i)
+            else:
+                results[i] = self._evaluate_leaf(leaf)
+
+        for entity_metric, indices in groups.items():
+            group_scores = self.metrics_manager.compute_best_match_scores(
+                sequence_pairs=[(leaves[i].ref, leaves[i].ext) for i in indices],
+                scorer=entity_metric,
+            )
+            for i, scores in zip(indices, group_scores):
+                results[i] = self.metrics_manager.compute_set_scores(
+                    data=scores,
+                    scorer=leaves[i].set_metric,
+                    threshold=leaves[i].threshold,
+                )
+
+        return results
+
     def _recursive_compare(
         self,
         ref_node: Any,
@@ -192,7 +311,10 @@ class MetadataComparator:
         threshold: float = 99.0,
     ) -> None:
         """
-        Recursively compare extracted vs. reference metadata nodes.
+        Compare extracted vs. reference metadata nodes.
+
+        Leaves are collected first, then evaluated in batches grouped by entity metric (see
+        `_evaluate_leaves`) and recorded in traversal order.
 
         Args:
             ref_node: dict or list (from deep_extract reference metadata)
@@ -200,57 +322,25 @@ class MetadataComparator:
             results: Dict to accumulate comp_results keyed by hierarchical attribute paths.
             prefix: str, current path prefix to form hierarchical keys.
         """
-        # Case 1: Both nodes are dicts -> recurse on keys
-        if isinstance(ref_node, Mapping) and isinstance(ext_node, Mapping):
-            all_keys = set(ref_node.keys()) | set(ext_node.keys())
-            for key in all_keys:
-                new_prefix = f"{prefix}.{key}" if prefix else key
-                ref_subnode = ref_node.get(key, [])
-                ext_subnode = ext_node.get(key, [])
-                self._recursive_compare(
-                    ref_node=ref_subnode,
-                    ext_node=ext_subnode,
-                    results=results,
-                    prefix=new_prefix,
-                    threshold=threshold,
-                )
-
-        # Case 2: Leaf nodes (lists) -> evaluate directly
-        else:
-            # Defensive: convert to list if not list
-            ref_list = ref_node if isinstance(ref_node, list) else [ref_node]
-            ext_list = ext_node if isinstance(ext_node, list) else [ext_node]
-
-            # Convert all to strings for consistent fuzzy matching
-            ref_list_str = list(map(str, ref_list))
-            ext_list_str = list(map(str, ext_list))
-
-            entity_metric_, set_metric_, threshold = self._get_score(field=prefix)
-
-            # Evaluate similarity metrics
-            comp_results = self.evaluate(
-                reference_list=ref_list_str,
-                extracted_list=ext_list_str,
-                entity_metric=entity_metric_,
-                set_metric=set_metric_,
-                threshold=threshold,
-            )
+        leaves: List[LeafJob] = []
+        self._collect_leaves(ref_node=ref_node, ext_node=ext_node, leaves=leaves, prefix=prefix)
 
+        for leaf, comp_results in zip(leaves, self._evaluate_leaves(leaves)):
             if comp_results:
                 self._evaluation_data.append(
                     (
-                        prefix,
-                        ref_list_str,
-                        ext_list_str,
+                        leaf.prefix,
+                        leaf.ref,
+                        leaf.ext,
                         comp_results.e_metric,
                         comp_results.e_score,
                         comp_results.s_metric,
                         comp_results.s_score,
-                        threshold,
+                        leaf.threshold,
                     )
                 )
 
-            results[prefix] = comp_results or {"accuracy": 0}
+            results[leaf.prefix] = comp_results or {"accuracy": 0}
 
     def compare_metadata(self, indexed_mode: bool = False) -> Dict[int, Any]:
         """
@@ -263,8 +353,16 @@ class MetadataComparator:
             Dictionary with comparison results, keyed by attribute paths.
         """
         self._evaluation_data.clear()
-
-        ref_data = self.deep_extract(model=self.reference, indexed=indexed_mode)
+        if self._score_cache_manager is not self.metrics_manager:
+            self._score_cache.clear()
+            self._score_cache_manager = self.metrics_manager
+
+        # The reference is usually compared against many extracted models; reuse its extraction
+        # while the same reference object and mode are used (replace, don't mutate, the reference)
+        if self._ref_data_key is None or self._ref_data_key[0] is not self.reference or self._ref_data_key[1] != indexed_mode:
+            self._ref_data = self.deep_extract(model=self.reference, indexed=indexed_mode)
+            self._ref_data_key = (self.reference, indexed_mode)
+        ref_data = self._ref_data
         ext_data = self.deep_extract(model=self.extracted, indexed=indexed_mode)
 
         results: Dict[str, Dict[str, float]] = {}
@@ -61,6 +61,10 @@ class FirestoreService(BaseDatastore):
         self._firestore_client = firestore.Client.from_service_account_json(str(p))
         self._storage_client = storage.Client.from_service_account_json(str(p))
 
+    def close(self) -> None:
+        """Release the underlying Firestore and Storage client connections."""
+        self._firestore_client.close()
+        self._storage_client.close()
 
     def _get_document_path(self, user_id: str, collection_id: str, document_id: str) -> DocumentReference:
         """Get document reference for a user's collection document"""
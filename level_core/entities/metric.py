@@ -1,11 +1,13 @@
 """levelapp/entities/metric.py"""
+from dataclasses import dataclass
 from typing import Callable, Any, List
 
 from pydantic import BaseModel, Field
 
 
-class Metric(BaseModel):
-    """Represents a metric for evaluation"""
+@dataclass(slots=True, frozen=True)
+class Metric:
+    """Represents a metric for evaluation (plain carrier; nothing to validate)"""
     name: str
     compute: Callable[[Any, Any], float]
     description: str = ""
@@ -10,8 +10,8 @@ from levelapp.entities.test_case import TestCase
 
 class EvaluationSession(BaseModel):
     """Represents an evaluation session for tracking a run."""
-    session_id: str = str(uuid4())
-    timestamp: datetime = datetime.now()
+    session_id: str = Field(default_factory=lambda: str(uuid4()))
+    timestamp: datetime = Field(default_factory=datetime.now)
     config: Dict[str, Any]
     test_cases: List[TestCase] = Field(default_factory=list)
     results: List[Dict[str, Any]] = Field(default_factory=list)
@@ -5,17 +5,121 @@ This module defines an abstract interface and common logic for evaluating
 generated text against expected outcomes using LLMs. Specific implementations
 (e.g., OpenAI, IONOS) should subclass `BaseEvaluator`.
 """
+import asyncio
 import re
-import json
+
+import httpx
+import orjson
 
 from abc import ABC, abstractmethod
 from logging import Logger
 from typing import Union, Dict, Optional
 
-from tenacity import stop_after_attempt, wait_exponential, retry
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
+from .rate_limiter import TokenBucket, estimate_tokens
 from .schemas import EvaluationConfig, EvaluationResult
 
+# HTTP/2 client shared by all evaluators so provider calls reuse pooled connections
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_HTTP_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, (re)creating it if it is closed or bound to another event loop."""
+    global _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed or _HTTP_CLIENT_LOOP is not loop:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=300,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        )
+        _HTTP_CLIENT_LOOP = loop
+    return _HTTP_CLIENT
+
+
+async def aclose_http_client() -> None:
+    """Close the shared client (call on application shutdown)."""
+    global _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+    _HTTP_CLIENT, _HTTP_CLIENT_LOOP = None, None
+
+
+# Statuses that signal a transient provider condition (rate limit, overload, outage) worth retrying;
+# any other 4xx is a client error and fails fast
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Decide whether a failed provider call should be retried.
+
+    Args:
+        exc (BaseException): Exception raised by the provider call.
+
+    Returns:
+        bool: True for network/transport failures and retryable HTTP statuses.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+# Retry policy for provider calls, built once at import. AsyncRetrying keeps per-run state
+# (attempt number, statistics), so each evaluation iterates over its own cheap copy
+_RETRY_POLICY = AsyncRetrying(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30, jitter=0.5),
+    retry=retry_if_exception(is_transient_error),
+    reraise=True,
+)
+
+
+# Outermost {...} block, used when the LLM wraps its JSON in extra text
+_JSON_BLOCK_PATTERN = re.compile(r"(\{.*\})", re.DOTALL)
+
+
+def _extract_json_block(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} block in `text` with a single linear scan.
+
+    Braces inside JSON string literals (including escaped quotes) are ignored.
+
+    Args:
+        text (str): Raw output string from the LLM.
+
+    Returns:
+        Optional[str]: The first complete JSON object candidate, or None if there is none.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+
+    return None
+
 
 class BaseEvaluator(ABC):
     """Abstract base class for implementing text evaluation via LLMs."""
@@ -30,6 +134,11 @@ class BaseEvaluator(ABC):
         self.config = config
         self.logger = logger
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP/2 client shared by every evaluator instance (must be used inside the event loop)."""
+        return get_http_client()
+
     @abstractmethod
     def build_prompt(self, user_message: Optional[str], generated_text: str, expected_text: str) -> str:
         """
@@ -62,7 +171,8 @@ class BaseEvaluator(ABC):
         """
         Safely parse JSON string output from LLM.
 
-        Uses regex as a fallback to extract JSON-like structure if direct parsing fails.
+        If direct parsing fails, falls back to the first balanced {...} block in the output,
+        then to the span from the first '{' to the last '}'.
 
         Args:
             output (str): Raw output string from the LLM.
@@ -71,37 +181,71 @@ class BaseEvaluator(ABC):
             Dict: Parsed output dictionary or an error message.
         """
         try:
-            return json.loads(output)
-        except json.JSONDecodeError:
-            match = re.search(r"(\{.*\})", output, re.DOTALL)
-            if match:
+            return orjson.loads(output)
+        except orjson.JSONDecodeError:
+            block = _extract_json_block(output)
+            if block is not None:
+                try:
+                    return orjson.loads(block)
+                except orjson.JSONDecodeError:
+                    pass
+
+            match = _JSON_BLOCK_PATTERN.search(output)
+            if match and match.group(1) != block:
                 try:
-                    return json.loads(match.group(1))
-                except json.JSONDecodeError:
+                    return orjson.loads(match.group(1))
+                except orjson.JSONDecodeError:
                     pass
 
             return {"error": "Invalid JSON output"}
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
-    async def evaluate(self, generated_text: str, expected_text: str, user_message: Optional[str] = None) -> EvaluationResult:
+    async def evaluate(
+            self,
+            generated_text: str,
+            expected_text: str,
+            user_message: Optional[str] = None,
+            rate_limiter: Optional[TokenBucket] = None,
+    ) -> EvaluationResult:
         """Evaluate generated text against expected text using an LLM.
 
-        Handles retry logic and fallback parsing for robustness.
+        Transient provider failures (see `is_transient_error`) are retried with jittered
+        exponential backoff; fallback parsing handles loosely formatted JSON.
 
         Args:
             generated_text (str): The model-generated response.
             expected_text (str): The expected or reference response.
             user_message (Optional[str]): Original user input (for context / key point extraction).
+            rate_limiter (Optional[TokenBucket]): Provider rate limit; every attempt, retries
+                included, takes one request and the prompt's estimated tokens from it.
 
         Returns:
             EvaluationResult: Structured result of the evaluation.
         """
         prompt = self.build_prompt(user_message=user_message, generated_text=generated_text, expected_text=expected_text)
-        response = await self.call_llm(prompt)
+        prompt_tokens = estimate_tokens(prompt)
+        # Only the provider call is retried; the prompt is built once
+        async for attempt in _RETRY_POLICY.copy():
+            with attempt:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire(prompt_tokens)
+                response = await self.call_llm(prompt)
 
         if isinstance(response, dict):
+            if "error" in response:
+                # call_llm reports provider/parse failures as {"error": ..., "details": ...}; keep them in
+                # metadata so callers can tell a failed call from a genuine zero score
+                metadata = dict(response.get("metadata") or {})
+                metadata["error"] = response["error"]
+                if "details" in response:
+                    metadata["details"] = response["details"]
+                return EvaluationResult(
+                    match_level=0,
+                    justification=f"Evaluation failed: {response['error']}",
+                    metadata=metadata,
+                )
             return EvaluationResult.model_validate(response)
         return EvaluationResult(
             match_level=0,
-            justification=f"Evaluation failed: {response}"
+            justification=f"Evaluation failed: {response}",
+            metadata={"error": str(response)},
         )
\ No newline at end of file
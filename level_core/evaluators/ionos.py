@@ -4,61 +4,84 @@
 This module defines a concrete implementation of the `BaseEvaluator` class
 using IONOS-hosted language models for evaluating generated vs expected text.
 """
-import uuid
+import random
 import httpx
+import orjson
 from logging import Logger
 from typing import Union, Dict
 
-from .base import BaseEvaluator
+from .base import BaseEvaluator, is_transient_error
+from .schemas import EvaluationConfig
 
+# The rubric and output format come first and never change, so every prompt shares the same
+# token prefix (lets provider-side prompt caching reuse it); only the texts under evaluation trail it
+_PROMPT_TEMPLATE = "\n".join([
+    "You are an expert text evaluator. Compare generated text to expected text for semantic similarity, factual accuracy, completeness.",
+    "Provide a score 0-5 and a concise justification (<=35 words).",
+    "Scoring: 5 perfect; 4 excellent minor style diffs; 3 good minor omissions; 2 moderate noticeable gaps; 1 poor major issues; 0 no match.",
+    "Return ONLY JSON: {{\"match_level\": <0-5>, \"justification\": \"<reason>\", \"metadata\": {{}}}}",
+    "User Message:", '"""', "{user_message}", '"""',
+    "Expected:", '"""', "{expected_text}", '"""',
+    "Generated:", '"""', "{generated_text}", '"""',
+])
 
 class IonosEvaluator(BaseEvaluator):
     """Evaluator that uses the IONOS inference API to score agent responses."""
 
+    def __init__(self, config: EvaluationConfig, logger: Logger):
+        """
+        Args:
+            config (EvaluationConfig): Configuration for the IONOS endpoint and model.
+            logger (Logger): Logger for error/debug reporting.
+        """
+        super().__init__(config, logger)
+        # Request URL and headers depend only on the config, so build them once
+        self._url = f"{config.api_url}/{config.model_id}/predictions"
+        self._headers = {
+            "Authorization": f"Bearer {config.api_key}",
+            "Content-Type": "application/json",
+        }
+
     def build_prompt(self, user_message: str | None, generated_text: str, expected_text: str) -> str:
         """Construct evaluation prompt (score + justification only)."""
-        user_msg = user_message or "(no user message provided)"
-        return "\n".join([
-            "You are an expert text evaluator. Compare generated text to expected text for semantic similarity, factual accuracy, completeness.",
-            "Provide a score 0-5 and a concise justification (<=35 words).",
-            "Scoring: 5 perfect; 4 excellent minor style diffs; 3 good minor omissions; 2 moderate noticeable gaps; 1 poor major issues; 0 no match.",
-            "User Message:", '"""', user_msg, '"""',
-            "Expected:", '"""', expected_text, '"""',
-            "Generated:", '"""', generated_text, '"""',
-            "Return ONLY JSON: {\"match_level\": <0-5>, \"justification\": \"<reason>\", \"metadata\": {}}",
-        ])
+        return _PROMPT_TEMPLATE.format_map({
+            "user_message": user_message or "(no user message provided)",
+            "expected_text": expected_text,
+            "generated_text": generated_text,
+        })
 
     async def call_llm(self, prompt: str) -> Union[Dict, str]:
         """Send the evaluation prompt to the IONOS API and return parsed response."""
-        url = f"{self.config.api_url}/{self.config.model_id}/predictions"
-        headers = {
-            "Authorization": f"Bearer {self.config.api_key}",
-            "Content-Type": "application/json",
-        }
         payload = {
             "properties": {"input": prompt},
             "option": {
                 **self.config.llm_config,
-                "seed": uuid.uuid4().int & ((1 << 16) - 1),
+                "seed": random.getrandbits(16),
             }
         }
 
+        # Network errors (httpx.RequestError) propagate to the retry in `evaluate`
         try:
-            async with httpx.AsyncClient(timeout=300) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-
-                output = response.json().get("properties", {}).get("output", "").strip()
-                parsed_output = self._parse_json_output(output)
+            # Encode with orjson (bytes, compact); self._headers already sets the JSON content type
+            response = await self.http_client.post(self._url, headers=self._headers, content=orjson.dumps(payload))
+            response.raise_for_status()
+        except httpx.HTTPStatusError as status_err:
+            # Rate limits and server errors are retried too; other client errors fail fast
+            if is_transient_error(status_err):
+                raise
+            self.logger.error("IONOS API request rejected: %s", str(status_err))
+            return {"error": "API request failed", "details": str(status_err)}
 
-                metadata = {
-                    "inputTokens": response.json().get("metadata", {}).get("inputTokens"),
-                    "outputTokens": response.json().get("metadata", {}).get("outputTokens"),
-                }
-                parsed_output["metadata"] = metadata
+        # Decode the body once, with orjson rather than httpx's stdlib-json response.json()
+        data = orjson.loads(response.content)
+        output = data.get("properties", {}).get("output", "").strip()
+        parsed_output = self._parse_json_output(output)
 
-                return parsed_output or {"error": "Empty API response"}
+        response_metadata = data.get("metadata", {})
+        metadata = {
+            "inputTokens": response_metadata.get("inputTokens"),
+            "outputTokens": response_metadata.get("outputTokens"),
+        }
+        parsed_output["metadata"] = metadata
 
-        except httpx.RequestError as req_err:
-            self.logger.error("IONOS API request failed: %s", str(req_err), exc_info=True)
-            return {"error": "API request failed", "details": str(req_err)}
\ No newline at end of file
+        return parsed_output or {"error": "Empty API response"}
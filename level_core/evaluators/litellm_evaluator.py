@@ -8,6 +8,9 @@ from .schemas import EvaluationConfig, EvaluationResult
 
 logger = logging.getLogger("LiteLLMEvaluator")
 
+# Fixed instruction sent first as the system message, so the prompt prefix is identical across calls
+_SYSTEM_PROMPT = "Is the output correct? Provide a short justification."
+
 class LiteLLMEvaluator:
     """
     Evaluates LLM outputs against expected responses using LiteLLM.
@@ -18,9 +21,11 @@ class LiteLLMEvaluator:
         
         if not config.model_id:
             logger.warning("No model_id provided. Switching to OpenAI default.")
-            self.config.model_id = "gpt-4o-mini"  # default OpenAI model
-            self.config.api_key = os.getenv("OPENAI_API_KEY")
-            self.config.api_url = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+            self.config = config.model_copy(update={
+                "model_id": "gpt-4o-mini",  # default OpenAI model
+                "api_key": os.getenv("OPENAI_API_KEY"),
+                "api_url": os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1"),
+            })
             if not self.config.api_key:
                 logger.error("OpenAI API key is missing. Please set OPENAI_API_KEY.")
                 raise ValueError("Missing OpenAI API key.")
@@ -28,14 +33,15 @@ class LiteLLMEvaluator:
         logger.info(f"Using model: {self.config.model_id} | Additional config: {self.config.llm_config}")
 
     async def evaluate(self, prompt: str, expected_response: str, attempted_fallback=False) -> EvaluationResult:
-        eval_prompt = f"""Output: {prompt}
-                        Expected: {expected_response}
-                        Is the output correct? Provide a short justification."""
+        eval_prompt = f"Output: {prompt}\nExpected: {expected_response}"
         loop = asyncio.get_running_loop()
         def sync_call():
             return litellm.completion(
                 model=self.config.model_id,
-                messages=[{"role": "user", "content": eval_prompt}],
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": eval_prompt},
+                ],
                 temperature=self.config.llm_config.get("temperature", 0.0),
                 max_tokens=self.config.llm_config.get("max_tokens", 150),
                 api_base=self.config.api_url,
@@ -62,9 +68,11 @@ class LiteLLMEvaluator:
                     metadata={"error": str(e)}
                 )
             logger.warning(f"Auth failed for {self.config.model_id}, retrying with OpenAI fallback...")
-            self.config.model_id = os.getenv("OPENAI_MODEL_ID", "gpt-4o-mini")
-            self.config.api_key = os.getenv("OPENAI_API_KEY")
-            self.config.api_url = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+            self.config = self.config.model_copy(update={
+                "model_id": os.getenv("OPENAI_MODEL_ID", "gpt-4o-mini"),
+                "api_key": os.getenv("OPENAI_API_KEY"),
+                "api_url": os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1"),
+            })
             if not self.config.api_key:
                 logger.error("OpenAI API key missing. Cannot continue.")
                 return EvaluationResult(
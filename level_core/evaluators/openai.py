@@ -1,25 +1,45 @@
 """
 'evaluators/openai.py': OpenAI-based LLM evaluator implementation.
 
-Uses LangChain with OpenAI's function-calling and structured output to evaluate
-the quality of generated vs expected text using a predefined rubric.
+Calls OpenAI's chat completions API directly through the async SDK, in JSON mode,
+to evaluate the quality of generated vs expected text using a predefined rubric.
 """
 from typing import Union, Dict, Optional
 from logging import Logger
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+from langchain_community.callbacks.openai_info import get_openai_token_cost_for_model
+from openai import AsyncOpenAI
 
-from langchain_community.callbacks import get_openai_callback
-from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+from .base import BaseEvaluator, get_http_client
+from .schemas import EvaluationConfig
 
-from .base import BaseEvaluator
-from .schemas import EvaluationConfig, EvaluationResult
+# Model used when the provider config does not name one
+_DEFAULT_MODEL = "gpt-4o-mini"
+
+# Static rubric sent as the system message; it is identical for every call, so the request
+# prefix stays stable and can be served from OpenAI's automatic prompt cache
+_SYSTEM_RUBRIC = "\n".join([
+    "You are an expert text evaluator. Score generated vs expected for semantic similarity, factual accuracy, completeness.",
+    "Provide only JSON: {\"match_level\": <0-5>, \"justification\": \"<<=35 words reason>\", \"metadata\": {}}",
+    "Scale: 5 perfect; 4 excellent; 3 good; 2 moderate gaps; 1 poor; 0 no match/incorrect.",
+])
+
+# Retry budget and per-call timeout (seconds) handed to the OpenAI SDK
+_MAX_RETRIES = 4
+_REQUEST_TIMEOUT = 120
+
+_PROMPT_TEMPLATE = "\n".join([
+    "User Message:", '"""', "{user_message}", '"""',
+    "",
+    "Expected:", '"""', "{expected_text}", '"""',
+    "",
+    "Generated:", '"""', "{generated_text}", '"""',
+])
 
 
 class OpenAIEvaluator(BaseEvaluator):
-    """Evaluator that uses OpenAI's GPT models via LangChain for structured evaluation."""
+    """Evaluator that uses OpenAI's GPT models (JSON mode) for structured evaluation."""
     def __init__(self, config: EvaluationConfig, logger: Logger):
         """
         Args:
@@ -27,56 +47,86 @@ class OpenAIEvaluator(BaseEvaluator):
             logger (Logger): Logger for error/debug reporting.
         """
         super().__init__(config, logger)
-        self.SystemMessage = SystemMessage
-        self.HumanMessage = HumanMessage
-        self.ChatPromptTemplate = ChatPromptTemplate
-        self.ChatOpenAI = ChatOpenAI
+        self._model = config.model_id or _DEFAULT_MODEL
+        self._client: Optional[AsyncOpenAI] = None
+        self._client_http: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> AsyncOpenAI:
+        """
+        One SDK client per evaluator, created on first use (it raises without an API key).
+
+        The client sends its requests over the shared evaluator HTTP pool, which is closed on
+        application shutdown, and is rebuilt whenever that pool has been replaced. It retries
+        connection errors, 429 and 5xx itself, with jittered backoff.
+        """
+        http_client = get_http_client()
+        if self._client is None or self._client_http is not http_client:
+            self._client = AsyncOpenAI(
+                api_key=self.config.api_key or None,
+                base_url=self.config.api_url or None,
+                max_retries=_MAX_RETRIES,
+                timeout=_REQUEST_TIMEOUT,
+                http_client=http_client,
+            )
+            self._client_http = http_client
+        return self._client
 
     def build_prompt(self, user_message: Optional[str], generated_text: str, expected_text: str) -> str:
-        """Simplified evaluation prompt (heuristic key points handled outside)."""
-        user_msg = user_message or "(no user message provided)"
-        parts = [
-            "You are an expert text evaluator. Score generated vs expected for semantic similarity, factual accuracy, completeness.",
-            "Provide only JSON: {\"match_level\": <0-5>, \"justification\": \"<<=35 words reason>\", \"metadata\": {}}",
-            "Scale: 5 perfect; 4 excellent; 3 good; 2 moderate gaps; 1 poor; 0 no match/incorrect.",
-            "",
-            "User Message:", '"""', user_msg, '"""',
-            "",
-            "Expected:", '"""', expected_text, '"""',
-            "",
-            "Generated:", '"""', generated_text, '"""',
-        ]
-        return "\n".join(parts)
-
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+        """Dynamic part of the evaluation prompt; the rubric is sent separately as the system message."""
+        return _PROMPT_TEMPLATE.format_map({
+            "user_message": user_message or "(no user message provided)",
+            "expected_text": expected_text,
+            "generated_text": generated_text,
+        })
+
     async def call_llm(self, prompt: str) -> Union[Dict, str]:
         """Send evaluation prompt and return structured result with token + key point metadata."""
         try:
-            messages = [
-                self.SystemMessage(content="You are an evaluation assistant."),
-                self.HumanMessage(content=prompt)
-            ]
-            prompt_template = self.ChatPromptTemplate.from_messages(messages=messages)
-
-            llm = self.ChatOpenAI(model="gpt-4o-mini", temperature=0)
-            with get_openai_callback() as cb:
-                chain = prompt_template | llm
-                raw = await chain.ainvoke({})
-                # Fallback heuristic: we expect model text output containing JSON
-                content = getattr(raw, 'content', '') if raw else ''
-                parsed = self._parse_json_output(content) if content else {}
-                meta = {
-                    "inputTokens": cb.prompt_tokens,
-                    "outputTokens": cb.completion_tokens,
-                    "total_cost": cb.total_cost,
-                }
-                if isinstance(parsed, dict):
-                    parsed.setdefault("metadata", {})
-                    if isinstance(parsed["metadata"], dict):
-                        parsed["metadata"].update(meta)
-                else:
-                    parsed = {"match_level": 0, "justification": "Non-JSON output", "metadata": meta}
-                return parsed
+            response = await self._get_client().chat.completions.create(
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": _SYSTEM_RUBRIC},
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0,
+                response_format={"type": "json_object"},
+            )
         except Exception as ex:
             self.logger.error(f"[call_llm] OpenAI API request failed: {ex}", exc_info=True)
             return {"error": "API request failed", "details": str(ex)}
+
+        content = response.choices[0].message.content if response.choices else None
+        parsed = self._parse_json_output(content) if content else {}
+        meta = self._usage_metadata(response.usage)
+        if isinstance(parsed, dict):
+            parsed.setdefault("metadata", {})
+            if isinstance(parsed["metadata"], dict):
+                parsed["metadata"].update(meta)
+        else:
+            parsed = {"match_level": 0, "justification": "Non-JSON output", "metadata": meta}
+        return parsed
+
+    def _usage_metadata(self, usage) -> Dict:
+        """
+        Token counts and estimated cost for one completion.
+
+        Args:
+            usage: The `usage` block of a chat completion response (may be None).
+
+        Returns:
+            Dict: inputTokens, outputTokens and total_cost (0.0 for models without known pricing).
+        """
+        prompt_tokens = usage.prompt_tokens if usage else 0
+        completion_tokens = usage.completion_tokens if usage else 0
+        try:
+            total_cost = (
+                get_openai_token_cost_for_model(self._model, prompt_tokens)
+                + get_openai_token_cost_for_model(self._model, completion_tokens, is_completion=True)
+            )
+        except ValueError:
+            total_cost = 0.0
+        return {
+            "inputTokens": prompt_tokens,
+            "outputTokens": completion_tokens,
+            "total_cost": total_cost,
+        }
@@ -0,0 +1,86 @@
+"""
+'evaluators/rate_limiter.py': Token-bucket rate limiting for LLM provider calls.
+"""
+import asyncio
+import time
+from typing import Optional
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    """
+    Roughly estimate the token count of the given texts (~4 characters per token).
+
+    Args:
+        *texts (Optional[str]): Texts sent to the LLM.
+
+    Returns:
+        int: Estimated number of tokens.
+    """
+    return sum(len(text) for text in texts if text) // 4
+
+
+class TokenBucket:
+    """
+    Two-axis token bucket limiting both requests per minute (RPM) and tokens per minute (TPM).
+
+    Both buckets start full and refill continuously at `limit / 60` per second. A call to
+    `acquire` waits until one request and the estimated number of tokens are available.
+    """
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None):
+        """
+        Args:
+            requests_per_minute (Optional[float]): RPM limit; None disables the request axis.
+            tokens_per_minute (Optional[float]): TPM limit; None disables the token axis.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_tokens = float(requests_per_minute or 0)
+        self.token_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill, capped at bucket capacity."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute:
+            self.request_tokens = min(
+                self.requests_per_minute,
+                self.request_tokens + elapsed * self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute:
+            self.token_tokens = min(
+                self.tokens_per_minute,
+                self.token_tokens + elapsed * self.tokens_per_minute / 60,
+            )
+
+    def _wait_time(self, tokens: float) -> float:
+        """Seconds until one request and `tokens` tokens are available (0 if available now)."""
+        wait = 0.0
+        if self.requests_per_minute and self.request_tokens < 1:
+            wait = max(wait, (1 - self.request_tokens) * 60 / self.requests_per_minute)
+        if self.tokens_per_minute and self.token_tokens < tokens:
+            wait = max(wait, (tokens - self.token_tokens) * 60 / self.tokens_per_minute)
+        return wait
+
+    async def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Wait until the call fits within both limits, then consume its share.
+
+        Args:
+            estimated_tokens (int): Estimated tokens for the call (capped at the TPM capacity).
+        """
+        tokens = min(estimated_tokens, self.tokens_per_minute) if self.tokens_per_minute else 0
+        while True:
+            # The lock only guards the bucket state; waiting happens outside it so other
+            # callers can refill/consume meanwhile, and the wait is recomputed afterwards
+            async with self._lock:
+                self._refill()
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    if self.requests_per_minute:
+                        self.request_tokens -= 1
+                    self.token_tokens -= tokens
+                    return
+            await asyncio.sleep(wait)
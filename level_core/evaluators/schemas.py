@@ -9,18 +9,20 @@ from pydantic import BaseModel, Field, ConfigDict
 class EvaluationConfig(BaseModel):
     """Configuration model for setting up an evaluator instance."""
 
-    model_config = ConfigDict(protected_namespaces=())  # Allows arbitrary field names
+    # protected_namespaces=() allows arbitrary field names; frozen because evaluators derive
+    # request state (URL, headers) from the config once and are cached per config instance
+    model_config = ConfigDict(protected_namespaces=(), frozen=True)
 
     api_url: Union[str, None] = None
     api_key: Union[str, None] = None
     model_id: Union[str, None] = None
 
-    llm_config: Dict = {
+    llm_config: Dict[str, Any] = Field(default_factory=lambda: {
         "top-k": 5,
         "top-p": 0.9,
         "temperature": 0.0,
         "max_tokens": 150,
-    }
+    })
 
 
 class EvaluationResult(BaseModel):
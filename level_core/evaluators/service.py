@@ -3,8 +3,10 @@
 """
 
 import os
+from collections import OrderedDict
+from hashlib import blake2b
 from logging import Logger
-from typing import Dict, Literal
+from typing import Dict, Literal, Optional, Tuple, Type
 
 from pydantic import ValidationError
 
@@ -13,8 +15,35 @@ from .schemas import EvaluationConfig, EvaluationResult
 from .openai import OpenAIEvaluator
 from .ionos import IonosEvaluator
 from .utils import extract_key_point
+from .rate_limiter import TokenBucket
 from config.loader import load_config
 
+# Evaluator implementation per provider name
+EVALUATOR_CLASSES: Dict[str, Type[BaseEvaluator]] = {
+    "ionos": IonosEvaluator,
+    "openai": OpenAIEvaluator,
+}
+
+# Maximum number of evaluation results kept in the per-service exact-match cache
+RESPONSE_CACHE_SIZE = int(os.getenv("EVALUATION_CACHE_SIZE", "10000"))
+
+
+def response_cache_key(
+        provider: str,
+        model_id: Optional[str],
+        output_text: str,
+        reference_text: str,
+        user_message: Optional[str],
+) -> str:
+    """Hash of every input that determines the evaluation prompt for a provider/model."""
+    digest = blake2b(digest_size=16)
+    for part in (provider, model_id or "", output_text, reference_text, user_message or ""):
+        encoded = part.encode("utf-8")
+        # Length-prefix each part so different splits of the same text never collide
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
 
 class EvaluationService:
     """Service layer to manage evaluator configurations and orchestrate evaluations."""
@@ -58,10 +87,47 @@ class EvaluationService:
                 )
 
         self.logger.info(f"[EvaluationService] Loaded providers: {list(self.configs.keys())}")
+        self.rate_limiters: Dict[str, TokenBucket] = {}
+        self._response_cache: "OrderedDict[str, EvaluationResult]" = OrderedDict()
+        # One evaluator per provider, reused while that provider's config object is unchanged
+        self._evaluators: Dict[str, Tuple[EvaluationConfig, BaseEvaluator]] = {}
+
+    def set_config(self, provider: Literal["ionos", "openai"], config: EvaluationConfig) -> None:
+        """
+        Set (or replace) the configuration of a provider.
+
+        Args:
+            provider (Literal): The name of the LLM provider.
+            config (EvaluationConfig): The provider configuration.
+        """
+        self.configs[provider] = config
+        self._evaluators.pop(provider, None)
+
+    def set_rate_limit(
+            self,
+            provider: Literal["ionos", "openai"],
+            requests_per_minute: Optional[float] = None,
+            tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        """
+        Throttle calls to a provider with a token bucket (RPM and/or TPM).
+
+        Args:
+            provider (Literal): The name of the LLM provider.
+            requests_per_minute (Optional[float]): Maximum requests per minute.
+            tokens_per_minute (Optional[float]): Maximum (estimated) tokens per minute.
+        """
+        self.rate_limiters[provider] = TokenBucket(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
+        self.logger.info(
+            f"[EvaluationService] Rate limit for '{provider}': rpm={requests_per_minute}, tpm={tokens_per_minute}"
+        )
 
     def _select_evaluator(self, provider: Literal["ionos", "openai"]) -> BaseEvaluator:
         """
-        Factory method to return the correct evaluator instance.
+        Factory method to return the correct evaluator instance (cached per provider config).
 
         Args:
             provider (Literal): The name of the LLM provider.
@@ -73,24 +139,25 @@ class EvaluationService:
             KeyError: If the provider or config is not found.
             ValueError: If the config is invalid.
         """
-        evaluator_map = {
-            "ionos": IonosEvaluator,
-            "openai": OpenAIEvaluator,
-        }
-
         if provider not in self.configs:
             raise KeyError(
                 f"Invalid or unconfigured provider: {provider}. "
                 f"Available: {list(self.configs.keys())}"
             )
 
+        config = self.configs[provider]
+        cached = self._evaluators.get(provider)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
         try:
-            config = self.configs[provider]
-            return evaluator_map[provider](config, self.logger)
+            evaluator = EVALUATOR_CLASSES[provider](config, self.logger)
+            self._evaluators[provider] = (config, evaluator)
+            return evaluator
         except KeyError:
             raise KeyError(
                 f"No evaluator defined for provider '{provider}'. "
-                f"Supported: {list(evaluator_map.keys())}"
+                f"Supported: {list(EVALUATOR_CLASSES.keys())}"
             )
         except ValidationError as e:
             raise ValueError(f"Invalid configuration for '{provider}': {e.errors()}")
@@ -117,13 +184,24 @@ class EvaluationService:
         if provider not in self.configs:
             raise ValueError(f"[evaluate_response] No configuration set for provider: {provider}")
 
+        # Deterministic (temperature 0) evaluations of identical inputs are served from cache
+        config = self.configs[provider]
+        cache_key = None
+        if not config.llm_config.get("temperature"):
+            cache_key = response_cache_key(provider, config.model_id, output_text, reference_text, user_message)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return cached.model_copy(deep=True)
+
         evaluator = self._select_evaluator(provider=provider)
 
         try:
             result = await evaluator.evaluate(
                 generated_text=output_text,
                 expected_text=reference_text,
-                user_message=user_message
+                user_message=user_message,
+                rate_limiter=self.rate_limiters.get(provider),
             )
         except Exception as e:
             # Do NOT crash the whole request; return a structured failure for this provider
@@ -146,4 +224,12 @@ class EvaluationService:
             "generated_key_point": kp_generated,
             "key_point_method": "heuristic_v1"
         })
+
+        # Failed evaluations (raised, or reported by the evaluator as metadata["error"]) are not
+        # cached so a later call can retry them
+        if cache_key is not None and "error" not in result.metadata:
+            self._response_cache[cache_key] = result.model_copy(deep=True)
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
         return result
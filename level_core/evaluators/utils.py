@@ -4,9 +4,10 @@
 
 import re
 import datetime
+from functools import lru_cache
 from typing import Any, Optional, Dict, Callable
 
-from rapidfuzz import fuzz  # Using Rapidfuzz's fuzz module for text similarity
+from rapidfuzz.distance import Indel  # Rapidfuzz's Indel distance backs its `fuzz.ratio` similarity
 
 # Define a flexible parser registry for field types, which can be customized later.
 FIELD_PARSERS: Dict[str, Callable[[Any], Any]] = {
@@ -16,9 +17,14 @@ FIELD_PARSERS: Dict[str, Callable[[Any], Any]] = {
     # You can add more parsers for other types dynamically if needed
 }
 
+# Date separators normalized to '-' and the formats tried in order by parse_date
+_DATE_SEPARATORS = re.compile(r'[/.]')
+_DATE_FORMATS = ('%d-%m-%Y', '%Y-%m-%d', '%m-%d-%Y')
+
+
 def levenshtein_f1(a: str, b: str) -> float:
     """
-    Computes an F1-like score using Rapidfuzz's Levenshtein scorer to approximate text similarity.
+    Computes an F1-like score (2 * matched characters / total characters) to approximate text similarity.
 
     Args:
         a (str): First string.
@@ -31,9 +37,11 @@ def levenshtein_f1(a: str, b: str) -> float:
     if not a or not b:
         return 0.0
 
-    # Using Rapidfuzz's Levenshtein score
-    score = fuzz.ratio(a, b) / 100  # `fuzz.ratio()` gives a score from 0-100, so divide by 100 for 0-1 range
-    return score
+    if a == b:
+        return 1.0
+
+    # Same score as `fuzz.ratio(a, b) / 100`, returned directly in the 0-1 range by the C++ kernel
+    return Indel.normalized_similarity(a, b)
 
 
 def parse_float(val: Any) -> Optional[float]:
@@ -52,18 +60,21 @@ def parse_float(val: Any) -> Optional[float]:
         return None
 
 
+@lru_cache(maxsize=4096)
 def parse_date(s: str) -> Optional[datetime.date]:
     """
     Attempt to parse a date from a string using flexible formats.
 
+    Results are memoized: batches repeat the same date strings, and strptime is costly.
+
     Args:
         s (str): Input date string.
 
     Returns:
         Optional[datetime.date]: Parsed date or None if parsing fails.
     """
-    s = re.sub(r'[/.]', '-', s)
-    for fmt in ('%d-%m-%Y', '%Y-%m-%d', '%m-%d-%Y'):
+    s = _DATE_SEPARATORS.sub('-', s)
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.datetime.strptime(s, fmt).date()
         except ValueError:
@@ -87,9 +98,68 @@ def parse_value(field_type: str, raw_val: Any) -> Any:
     return parser(raw_val)
 
 
-def compare_values(field_type: str, expected_val: Any, actual_val: Any) -> float:
+def _floats_match(expected_val: Any, actual_val: Any) -> bool:
+    """Float fields match within a 1e-6 tolerance (or when neither side parses as a float)."""
+    parsed_exp, parsed_act = parse_float(expected_val), parse_float(actual_val)
+    if parsed_exp is not None and parsed_act is not None:
+        # Using exact match if the float values are within a very small tolerance.
+        return abs(parsed_exp - parsed_act) < 1e-6
+    return parsed_exp == parsed_act
+
+
+def _dates_match(expected_val: Any, actual_val: Any) -> bool:
+    """Date fields match when both sides parse to the same date (or neither parses)."""
+    return parse_date(expected_val) == parse_date(actual_val)
+
+
+def _strings_match(expected_val: Any, actual_val: Any) -> bool:
+    """String fields match case- and surrounding-whitespace-insensitively."""
+    return str(expected_val).strip().lower() == str(actual_val).strip().lower()
+
+
+# Exact-match check per built-in field type, resolved once per field instead of per value
+_VALUE_MATCHERS: Dict[str, Callable[[Any, Any], bool]] = {
+    "float": _floats_match,
+    "date": _dates_match,
+    "string": _strings_match,
+}
+
+# The parsers the built-in matchers inline; a FIELD_PARSERS entry replaced at runtime disables
+# its built-in matcher so the custom parser is honored
+_DEFAULT_FIELD_PARSERS = dict(FIELD_PARSERS)
+
+
+def _matcher_for(field_type: str) -> Callable[[Any, Any], bool]:
     """
-    Compare two values for a specific field, using the appropriate parsing and similarity metrics.
+    Return the exact-match check for a field type.
+
+    Args:
+        field_type (str): The field's expected type (e.g., "float", "date").
+
+    Returns:
+        Callable[[Any, Any], bool]: Built-in matcher while the type's default parser is in place,
+        otherwise equality of values parsed through FIELD_PARSERS (float fields keep their 1e-6
+        tolerance; unknown types fall back to the string parser).
+    """
+    matcher = _VALUE_MATCHERS.get(field_type)
+    if matcher is not None and FIELD_PARSERS.get(field_type) is _DEFAULT_FIELD_PARSERS[field_type]:
+        return matcher
+
+    parser = FIELD_PARSERS.get(field_type, FIELD_PARSERS["string"])
+    if field_type == "float":
+        def floats_match(expected_val: Any, actual_val: Any) -> bool:
+            parsed_exp, parsed_act = parser(expected_val), parser(actual_val)
+            if parsed_exp is not None and parsed_act is not None:
+                return abs(parsed_exp - parsed_act) < 1e-6
+            return parsed_exp == parsed_act
+        return floats_match
+
+    return lambda expected_val, actual_val: parser(expected_val) == parser(actual_val)
+
+
+def _values_match(field_type: str, expected_val: Any, actual_val: Any) -> bool:
+    """
+    Check whether two values are equal once parsed for their field type.
 
     Args:
         field_type (str): The field's expected type (e.g., "float", "date").
@@ -97,20 +167,26 @@ def compare_values(field_type: str, expected_val: Any, actual_val: Any) -> float
         actual_val (Any): Predicted or extracted value.
 
     Returns:
-        float: Similarity score between 0.0 and 1.0.
+        bool: True if the parsed values match exactly (floats within a 1e-6 tolerance).
     """
-    parsed_exp = parse_value(field_type, expected_val)
-    parsed_act = parse_value(field_type, actual_val)
+    return _matcher_for(field_type)(expected_val, actual_val)
 
-    if field_type == "float" and parsed_exp is not None and parsed_act is not None:
-        # Using exact match if the float values are within a very small tolerance.
-        return 1.0 if abs(parsed_exp - parsed_act) < 1e-6 else levenshtein_f1(str(expected_val), str(actual_val))
 
-    if field_type == "date" and parsed_exp and parsed_act:
-        return 1.0 if parsed_exp == parsed_act else levenshtein_f1(str(expected_val), str(actual_val))
+def compare_values(field_type: str, expected_val: Any, actual_val: Any) -> float:
+    """
+    Compare two values for a specific field, using the appropriate parsing and similarity metrics.
+
+    Args:
+        field_type (str): The field's expected type (e.g., "float", "date").
+        expected_val (Any): Ground truth value.
+        actual_val (Any): Predicted or extracted value.
 
-    # Default comparison (strings and fallback)
-    return 1.0 if parsed_exp == parsed_act else levenshtein_f1(str(expected_val), str(actual_val))
+    Returns:
+        float: Similarity score between 0.0 and 1.0.
+    """
+    if _values_match(field_type, expected_val, actual_val):
+        return 1.0
+    return levenshtein_f1(str(expected_val), str(actual_val))
 
 
 def evaluate_metadata(expected: Dict[str, Any], actual: Dict[str, Any], field_types: Dict[str, str]) -> float:
@@ -131,7 +207,13 @@ def evaluate_metadata(expected: Dict[str, Any], actual: Dict[str, Any], field_ty
         return 0.0
 
     # Comparing values based on dynamic field types
-    scores = [compare_values(field_types.get(f, "string"), expected[f], actual.get(f)) for f in relevant]
+    scores = []
+    for f in relevant:
+        expected_val, actual_val = expected[f], actual.get(f)
+        if _matcher_for(field_types[f])(expected_val, actual_val):
+            scores.append(1.0)
+        else:
+            scores.append(levenshtein_f1(str(expected_val), str(actual_val)))
     return sum(scores) / len(scores)
 
 
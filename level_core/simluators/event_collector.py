@@ -1,11 +1,19 @@
 """
 levelapp_core_simulators/event_collector.py: Shared event collection logic for simulators.
 """
+import logging
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Deque
 
-# Global event list for demonstration; in production, this could be context-specific
-execution_events = []
+logger = logging.getLogger(__name__)
+
+# Oldest events are dropped beyond this many, so long-running processes stay bounded in memory
+MAX_EXECUTION_EVENTS = 100_000
+
+# Global event buffer for demonstration; in production, this could be context-specific
+execution_events: Deque[Dict[str, Any]] = deque(maxlen=MAX_EXECUTION_EVENTS)
+_dropping_events = False
 
 def add_event(level: str, message: str, context: Optional[Dict[str, Any]] = None):
     """
@@ -16,6 +24,11 @@ def add_event(level: str, message: str, context: Optional[Dict[str, Any]] = None
         message (str): The event message.
         context (Optional[Dict[str, Any]], optional): Additional context for the event. Defaults to None.
     """
+    global _dropping_events
+    if not _dropping_events and len(execution_events) == MAX_EXECUTION_EVENTS:
+        _dropping_events = True
+        logger.warning(f"[add_event] Event buffer full ({MAX_EXECUTION_EVENTS} events); dropping the oldest events from now on")
+
     execution_events.append({
         "timestamp": datetime.now().isoformat(),
         "level": level,
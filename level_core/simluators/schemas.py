@@ -1,6 +1,7 @@
 """
-levelapp_core_simulators/schemas.py: Generic Pydantic models for simulator data structures.
+levelapp_core_simulators/schemas.py: Generic Pydantic models (and internal dataclasses) for simulator data structures.
 """
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 from pydantic import BaseModel, Field
@@ -12,11 +13,12 @@ class InteractionType(str, Enum):
     DEVELOPMENT = "development"
     CLOSURE = "closure"
 
-class InteractionDetails(BaseModel):
-    """Model representing details of a simulated interaction."""
+@dataclass(slots=True)
+class InteractionDetails:
+    """Details of a simulated interaction (internal, built per response; plain dataclass, no validation)."""
     reply: Optional[str] = "No response"
-    extracted_metadata: Optional[Dict[str, Any]] = {}
-    handoff_details: Optional[Dict[str, Any]] = {}
+    extracted_metadata: Optional[Dict[str, Any]] = field(default_factory=dict)
+    handoff_details: Optional[Dict[str, Any]] = field(default_factory=dict)
     interaction_type: Optional[InteractionType] = InteractionType.OPENING
 
 class InteractionEvaluationResult(BaseModel):
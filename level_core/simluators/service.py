@@ -3,6 +3,7 @@ levelapp_core_simulators/service.py: Generic service layer for conversation simu
 """
 import asyncio
 import time
+import httpx
 from typing import Dict, Any, List, Callable, Optional
 from collections import defaultdict
 from datetime import datetime
@@ -37,18 +38,32 @@ class ConversationSimulator:
         self.collected_scores = defaultdict(list)
         self.evaluation_summaries = defaultdict(list)
         self.execution_events = []  # Collect execution events instead of logging
+        self.client: Optional[httpx.AsyncClient] = None
+        self._owns_client = False
+        self.max_concurrency: Optional[int] = None
 
 
-    def setup_simulator(self, endpoint: str, headers: Dict[str, str]):
+    def setup_simulator(
+            self,
+            endpoint: str,
+            headers: Dict[str, str],
+            client: Optional[httpx.AsyncClient] = None,
+            max_concurrency: Optional[int] = None,
+    ):
         """
         Set up the simulator with endpoint and headers.
 
         Args:
             endpoint (str): The endpoint URL for the simulator.
             headers (Dict[str, str]): HTTP headers for requests.
+            client (Optional[httpx.AsyncClient], optional): Shared HTTP client used for all endpoint calls.
+                If omitted, each batch test opens (and closes) its own pooled client.
+            max_concurrency (Optional[int], optional): Maximum number of scenarios simulated at once. Defaults to no limit.
         """
         self.endpoint = endpoint
         self.headers = headers
+        self.client = client
+        self.max_concurrency = max_concurrency
 
     async def run_batch_test(self, name: str, test_load: Dict[str, Any], attempts: int = 1) -> Dict[str, Any]:
         """
@@ -63,9 +78,21 @@ class ConversationSimulator:
             Dict[str, Any]: The test results with status information.
         """
         add_event("INFO", f"Starting batch test for batch: {name}")
+        if self.client is None:
+            # One pooled HTTP/2 client for every request of this batch instead of one per request
+            self.client = httpx.AsyncClient(
+                http2=True,
+                timeout=900,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            )
+            self._owns_client = True
+
         started_at = datetime.now().isoformat()
         start_time = time.time()
-        results = await self.simulate_conversation(attempts=attempts)
+        try:
+            results = await self.simulate_conversation(attempts=attempts)
+        finally:
+            await self.aclose()
         finished_at = datetime.now().isoformat()
         elapsed_time = time.time() - start_time
         average_execution_time = calculate_average(results["scenarios"])
@@ -83,6 +110,13 @@ class ConversationSimulator:
             self.persistence_fn(test_load)
         return results
 
+    async def aclose(self) -> None:
+        """Close the HTTP client if the simulator created it (a client passed to setup_simulator is left open)."""
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            self._owns_client = False
+
     async def simulate_conversation(self, attempts: int = 1) -> Dict[str, Any]:
         """
         Simulate conversations for all scenarios in the batch.
@@ -94,17 +128,29 @@ class ConversationSimulator:
             Dict[str, Any]: The simulation results with scenarios and average scores.
         """
         add_event("INFO", "Starting conversation simulation..")
-        semaphore = asyncio.Semaphore(value=len(self.batch.conversations))
-        async def run_with_semaphore(scenario: Any) -> Dict[str, Any]:
-            async with semaphore:
-                return await self.simulate_single_scenario(scenario=scenario, attempts=attempts)
-        results = await asyncio.gather(*(run_with_semaphore(s) for s in self.batch.conversations))
-        aggregate_scores: Dict[str, List[float]] = defaultdict(list)
+        scenarios = self.batch.conversations
+        if self.max_concurrency and self.max_concurrency < len(scenarios):
+            semaphore = asyncio.Semaphore(value=self.max_concurrency)
+            async def run_with_semaphore(scenario: Any) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.simulate_single_scenario(scenario=scenario, attempts=attempts)
+            results = await asyncio.gather(*(run_with_semaphore(s) for s in scenarios))
+        else:
+            # No effective limit: a semaphore sized to the batch would never block
+            results = await asyncio.gather(
+                *(self.simulate_single_scenario(scenario=s, attempts=attempts) for s in scenarios)
+            )
+        # Running sum/count per score key (one pass, no per-key lists); same rounding as calculate_average
+        score_totals: Dict[str, float] = {}
+        score_counts: Dict[str, int] = {}
         for scenarios_results in results:
-            for key, value in scenarios_results.get("averageScores", {}).items():
+            for key, value in scenarios_results.get("average_scores", {}).items():
                 if isinstance(value, (int, float)):
-                    aggregate_scores[key].append(value)
-        overall_average_scores = calculate_average(aggregate_scores)
+                    score_totals[key] = score_totals.get(key, 0.0) + value
+                    score_counts[key] = score_counts.get(key, 0) + 1
+        overall_average_scores = {
+            key: round(total / score_counts[key], 3) for key, total in score_totals.items()
+        }
         for provider, justifications in self.evaluation_summaries.items():
             self.evaluation_summaries[provider] = summarize_justifications(
                 justifications=justifications
@@ -130,6 +176,8 @@ class ConversationSimulator:
         add_event("INFO", f"Starting simulation for scenario: {scenario_id}")
         attempt_results = []
         all_attempts_scores = defaultdict(list)
+        # Request payloads are identical across attempts, so build them once per scenario
+        payloads = [{"prompt": interaction.user_message} for interaction in scenario.interactions]
         for attempt in range(attempts):
             add_event("INFO", f"Running attempt: {attempt+1}/{attempts}", {"scenario_id": scenario_id})
             start_time = time.time()
@@ -137,7 +185,8 @@ class ConversationSimulator:
             conversation_id = f"batch-{attempt+1}"
             interactions_results = await self.simulate__interactions(
                 scenario=scenario,
-                conversation_id=conversation_id
+                conversation_id=conversation_id,
+                payloads=payloads,
             )
 
             single_attempt_scores = calculate_average(self.collected_scores)
@@ -159,57 +208,87 @@ class ConversationSimulator:
             "average_scores": average_scores,
         }
 
-    async def simulate__interactions(self, scenario: BasicConversation, conversation_id: str) -> List[Dict[str, Any]]:
+    async def simulate__interactions(
+            self,
+            scenario: BasicConversation,
+            conversation_id: str,
+            payloads: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Simulate inbound interactions for a scenario.
 
         Args:
             scenario (BasicConversation): The scenario to simulate.
             conversation_id (str): The conversation ID.
+            payloads (Optional[List[Dict[str, Any]]], optional): Prebuilt request payload per interaction
+                (reused across attempts). Built from the interactions when omitted.
 
         Returns:
             List[Dict[str, Any]]: The results of the inbound interactions simulation.
         """
         add_event("INFO", "Starting inbound interactions simulation..")
         results = []
+        # Interactions are sent to the endpoint in order (turns may depend on each other), but each
+        # reply's evaluation runs as a task so it overlaps with the next interaction's request
+        pending_evaluations = []
         interactions_sequence = scenario.interactions
-        for interaction in interactions_sequence:
-            payload = {"prompt": interaction.user_message}
-            response = await async_request(
-                url=self.endpoint,
-                headers=self.headers,
-                payload=payload,
-            )
-            if not response or not response.status_code == 200:
-                add_event("ERROR", "Inbound interaction request failed.", {
-                    "status_code": response.status_code if response else "No response",
-                    "conversation_id": interaction.id,
-                    "user_message": interaction.user_message
-                })
+        if payloads is None:
+            payloads = [{"prompt": interaction.user_message} for interaction in interactions_sequence]
+        try:
+            for interaction, payload in zip(interactions_sequence, payloads):
+                # Stop sending turns once an evaluation has failed; the gather below re-raises its error
+                if any(
+                    task.done() and not task.cancelled() and task.exception() is not None
+                    for _, task in pending_evaluations
+                ):
+                    break
+                response = await async_request(
+                    url=self.endpoint,
+                    headers=self.headers,
+                    payload=payload,
+                    client=self.client,
+                )
+                if not response or not response.status_code == 200:
+                    add_event("ERROR", "Inbound interaction request failed.", {
+                        "status_code": response.status_code if response else "No response",
+                        "conversation_id": interaction.id,
+                        "user_message": interaction.user_message
+                    })
+                    result = {
+                        "user_message": interaction.user_message,
+                        "agent_reply": "Request failed",
+                        "reference_reply": getattr(interaction, 'reference_reply', None),
+                        "interaction_type": getattr(interaction, 'interaction_type', None),
+                        "reference_metadata": getattr(interaction, 'reference_metadata', {}),
+                        "generated_metadata": {},
+                        "evaluation_results": {},
+                    }
+                    results.append(result)
+                    continue
+
                 result = {
                     "user_message": interaction.user_message,
-                    "agent_reply": "Request failed",
+                    "agent_reply": response.text,
                     "reference_reply": getattr(interaction, 'reference_reply', None),
-                    "interaction_type": getattr(interaction, 'interaction_type', None),
+                    "interaction_type": None,
                     "reference_metadata": getattr(interaction, 'reference_metadata', {}),
                     "generated_metadata": {},
                     "evaluation_results": {},
                 }
                 results.append(result)
-                continue
-    
-            evaluation_results= await self.evaluate_interaction(response.text, interaction.reference_reply)
-
-            result = {
-                "user_message": interaction.user_message,
-                "agent_reply": response.text,
-                "reference_reply": getattr(interaction, 'reference_reply', None),
-                "interaction_type": None,
-                "reference_metadata": getattr(interaction, 'reference_metadata', {}),
-                "generated_metadata": {},
-                "evaluation_results": evaluation_results,
-            }
-            results.append(result)
+                pending_evaluations.append((
+                    result,
+                    asyncio.create_task(self.evaluate_interaction(response.text, interaction.reference_reply)),
+                ))
+
+            evaluations = await asyncio.gather(*(task for _, task in pending_evaluations))
+        finally:
+            # On failure (or cancellation) don't leave evaluations running unowned; no-op for finished tasks
+            for _, task in pending_evaluations:
+                task.cancel()
+
+        for (result, _), evaluation_results in zip(pending_evaluations, evaluations):
+            result["evaluation_results"] = evaluation_results
         return  results
     async def evaluate_interaction(
             self,
@@ -5,7 +5,6 @@ import json
 from typing import Dict, Any, Optional, List, Union
 import httpx
 import arrow
-from pydantic import ValidationError
 from collections import defaultdict
 from .schemas import InteractionDetails
 from .event_collector import add_event
@@ -26,11 +25,6 @@ def extract_interaction_details(response_text: str) -> InteractionDetails:
     try:
         # First try to parse as JSON
         data = json.loads(response_text)
-        payload = data.get("payload", {})
-        return InteractionDetails(
-            reply=payload.get("message", "No response"),
-            extracted_metadata=payload.get("metadata", {}),
-        )
     except json.JSONDecodeError:
         # If JSON parsing fails, treat as free text
         add_event("INFO", f"[extract_interaction_details] Processing as free text")
@@ -38,13 +32,23 @@ def extract_interaction_details(response_text: str) -> InteractionDetails:
             reply=response_text,
             extracted_metadata={},
         )
-    except ValidationError as err:
-        msg = f"[extract_interaction_details] Pydantic validation error: {err}"
+
+    payload = data.get("payload", {})
+    reply = payload.get("message", "No response")
+    extracted_metadata = payload.get("metadata", {})
+    # InteractionDetails is a plain dataclass, so check the field types it would otherwise validate
+    if not isinstance(reply, (str, type(None))) or not isinstance(extracted_metadata, (dict, type(None))):
+        msg = (
+            "[extract_interaction_details] Invalid payload types: "
+            f"message={type(reply).__name__}, metadata={type(extracted_metadata).__name__}"
+        )
         add_event("ERROR", msg)
         return InteractionDetails()
 
+    return InteractionDetails(reply=reply, extracted_metadata=extracted_metadata)
+
 
-async def async_request(url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> Optional[httpx.Response]:
+async def async_request(url: str, headers: Dict[str, str], payload: Dict[str, Any], client: Optional[httpx.AsyncClient] = None) -> Optional[httpx.Response]:
     """
     Performs an asynchronous HTTP POST request.
 
@@ -52,18 +56,21 @@ async def async_request(url: str, headers: Dict[str, str], payload: Dict[str, An
         url (str): The endpoint URL.
         headers (Dict[str, str]): HTTP headers to include in the request.
         payload (Dict[str, Any]): The JSON payload to send.
+        client (Optional[httpx.AsyncClient], optional): Shared client to reuse pooled connections. Defaults to a one-off client.
 
     Returns:
         Optional[httpx.Response]: The HTTP response if successful, otherwise None.
     """
     try:
-        msg = f"[async_request] Request payload:\n{payload}\n---"
-        async with httpx.AsyncClient(timeout=900) as client:
+        if client is not None:
             response = await client.post(url=url, headers=headers, json=payload)
-            msg = f"[async_request] Response:\n{response.text}\n---"
-            add_event("INFO", msg)
-            response.raise_for_status()
-            return response
+        else:
+            async with httpx.AsyncClient(timeout=900) as client:
+                response = await client.post(url=url, headers=headers, json=payload)
+        msg = f"[async_request] Response:\n{response.text}\n---"
+        add_event("INFO", msg)
+        response.raise_for_status()
+        return response
     except httpx.HTTPStatusError as http_err:
         msg = f"[async_request] HTTP error: {http_err.response.text}"
         add_event("ERROR", msg, {"exc_info": True})
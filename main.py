@@ -77,6 +77,12 @@ def read_json_file(file_path: str):
 if __name__ == "__main__":
     import os
 
+    try:
+        import uvloop  # not available on Windows; fall back to the default asyncio loop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     load_dotenv()  # Load environment variables from .env file
     try:
         evaluation_service = EvaluationService(logger=Logger("EvaluationService"))
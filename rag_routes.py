@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
 from typing import Dict, Any
 import os
+import logging
 from collections import defaultdict
 from dotenv import load_dotenv
 
@@ -23,6 +24,8 @@ from level_core.generators.service import GenerationService, GenerationConfig
 from level_core.evaluators.schemas import EvaluationConfig
 from level_core.simluators.event_collector import log_rag_event
 
+logger = logging.getLogger("levelapp")
+
 # Initialize router
 rag_router = APIRouter(prefix="/rag", tags=["RAG Evaluation"])
 
@@ -30,24 +33,29 @@ rag_router = APIRouter(prefix="/rag", tags=["RAG Evaluation"])
 _GLOBAL_SESSIONS: Dict[str, Dict[str, Any]] = defaultdict(dict)
 _SINGLETON_SIMULATOR = None
 
-# Configuration from environment
+# Configuration from environment, read once at import
+_ENV_CONFIG: Dict[str, Any] = {
+    # Default base URL for chatbot (no trailing slash). Can be overridden by request.
+    "chatbot_base_url": os.getenv("CHATBOT_BASE_URL", os.getenv("CHATBOT_ENDPOINT", "http://localhost:8000")),
+    # Default path for chat endpoint (leading slash). Can be overridden by request.
+    "chatbot_chat_path": os.getenv("CHATBOT_CHAT_PATH", "/"),
+    "openai_api_key": os.getenv("OPENAI_API_KEY"),
+    "ionos_api_key": os.getenv("IONOS_API_KEY"),
+    "ionos_api_url": os.getenv("IONOS_API_URL", "https://api.ionos.ai"),
+    "ionos_model_id": os.getenv("IONOS_MODEL_ID", ""),
+    "expected_model": os.getenv("LEVELAPP_EXPECTED_MODEL", "gpt-4o-mini"),
+}
+
 def get_config():
     """Get default configuration from environment variables.
 
     Note: The /rag/init endpoint requires a chatbot_base_url in the request.
     These env values act as developer defaults and are used only when explicitly
-    passed through by the client or for local tooling.
+    passed through by the client or for local tooling. They are read once at import;
+    treat the returned dictionary as read-only.
     """
-    config = {
-        # Default base URL for chatbot (no trailing slash). Can be overridden by request.
-        "chatbot_base_url": os.getenv("CHATBOT_BASE_URL", os.getenv("CHATBOT_ENDPOINT", "http://localhost:8000")),
-        # Default path for chat endpoint (leading slash). Can be overridden by request.
-        "chatbot_chat_path": os.getenv("CHATBOT_CHAT_PATH", "/"),
-        "openai_api_key": os.getenv("OPENAI_API_KEY"),
-        "ionos_api_key": os.getenv("IONOS_API_KEY")
-    }
     # Avoid logging API keys or prefixes to prevent leakage
-    return config
+    return _ENV_CONFIG
 
 def get_evaluation_service(config: Dict[str, str] = Depends(get_config)):
     """Get evaluation service instance with provider configs."""
@@ -58,7 +66,7 @@ def get_evaluation_service(config: Dict[str, str] = Depends(get_config)):
         svc.set_config("openai", EvaluationConfig(api_key=config["openai_api_key"], model_id="gpt-4o-mini"))
     # Configure IONOS if key present
     if config.get("ionos_api_key"):
-        svc.set_config("ionos", EvaluationConfig(api_key=config["ionos_api_key"], api_url=os.getenv("IONOS_API_URL", "https://api.ionos.ai"), model_id=os.getenv("IONOS_MODEL_ID", "")))
+        svc.set_config("ionos", EvaluationConfig(api_key=config["ionos_api_key"], api_url=config["ionos_api_url"], model_id=config["ionos_model_id"]))
     return svc
 
 def get_generation_service(config: Dict[str, str] = Depends(get_config)):
@@ -66,7 +74,7 @@ def get_generation_service(config: Dict[str, str] = Depends(get_config)):
     from logging import Logger
     gsvc = GenerationService(logger=Logger("RAGGeneration"))
     if config.get("openai_api_key"):
-        gsvc.set_config("openai", GenerationConfig(api_key=config["openai_api_key"], model_id=os.getenv("LEVELAPP_EXPECTED_MODEL", "gpt-4o-mini")))
+        gsvc.set_config("openai", GenerationConfig(api_key=config["openai_api_key"], model_id=config["expected_model"]))
     return gsvc
 
 def get_rag_simulator(config: Dict[str, str] = Depends(get_config), 
@@ -85,9 +93,9 @@ def get_rag_simulator(config: Dict[str, str] = Depends(get_config),
             headers=headers,
         )
         _SINGLETON_SIMULATOR.sessions = _GLOBAL_SESSIONS
-        print(f"DEBUG: Created new singleton simulator with {len(_GLOBAL_SESSIONS)} sessions")
+        logger.debug(f"Created new singleton simulator with {len(_GLOBAL_SESSIONS)} sessions")
     else:
-        print(f"DEBUG: Reusing singleton simulator with {len(_GLOBAL_SESSIONS)} sessions")
+        logger.debug(f"Reusing singleton simulator with {len(_GLOBAL_SESSIONS)} sessions")
     
     return _SINGLETON_SIMULATOR
 
@@ -102,8 +110,8 @@ async def initialize_rag_and_scrape(
     """
     try:
         result = await simulator.initialize_rag_and_scrape(request)
-        print(f"DEBUG: Session created: {result.session_id}")
-        print(f"DEBUG: Total sessions after init: {len(_GLOBAL_SESSIONS)}")
+        logger.debug(f"Session created: {result.session_id}")
+        logger.debug(f"Total sessions after init: {len(_GLOBAL_SESSIONS)}")
         log_rag_event("INFO", f"RAG initialized and scraped for {request.page_url}")
         # Convert to dict to ensure proper JSON serialization
         return JSONResponse(content=result.model_dump(mode='json'), status_code=status.HTTP_200_OK)
@@ -123,8 +131,8 @@ async def generate_expected_answer(
     Step 2: Generate expected answer from human-selected chunks.
     """
     try:
-        print(f"DEBUG: Looking for session: {request.session_id}")
-        print(f"DEBUG: Available sessions: {list(_GLOBAL_SESSIONS.keys())}")
+        logger.debug(f"Looking for session: {request.session_id}")
+        logger.debug(f"Available sessions: {list(_GLOBAL_SESSIONS.keys())}")
         result = await simulator.generate_expected_answer(request)
         log_rag_event("INFO", "Expected answer generated successfully")
         return JSONResponse(content=result.model_dump(mode='json'), status_code=status.HTTP_200_OK)
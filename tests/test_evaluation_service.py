@@ -0,0 +1,64 @@
+"""Tests for the exact-match response cache in EvaluationService.evaluate_response."""
+import asyncio
+import logging
+
+import pytest
+
+from level_core.evaluators import service as service_module
+from level_core.evaluators.ionos import IonosEvaluator
+from level_core.evaluators.service import EvaluationService
+
+_PROVIDERS = {
+    "providers": {
+        "ionos": {"api_key": "test-key", "api_url": "http://ionos.test", "model_id": "test-model"},
+    }
+}
+
+
+@pytest.fixture
+def evaluation_service(monkeypatch):
+    monkeypatch.setattr(service_module, "load_config", lambda path: _PROVIDERS)
+    return EvaluationService(logger=logging.getLogger("test-evaluation-service"))
+
+
+def _stub_call_llm(monkeypatch, response):
+    calls = []
+
+    async def call_llm(self, prompt):
+        calls.append(prompt)
+        return dict(response)
+
+    monkeypatch.setattr(IonosEvaluator, "call_llm", call_llm)
+    return calls
+
+
+def _evaluate(evaluation_service):
+    return asyncio.run(evaluation_service.evaluate_response(
+        provider="ionos",
+        output_text="The meeting is on Monday.",
+        reference_text="The meeting is on Monday.",
+    ))
+
+
+def test_error_response_is_not_cached(evaluation_service, monkeypatch):
+    calls = _stub_call_llm(monkeypatch, {"error": "API request failed", "details": "429 Too Many Requests"})
+
+    first = _evaluate(evaluation_service)
+    second = _evaluate(evaluation_service)
+
+    assert first.match_level == 0
+    assert first.metadata["error"] == "API request failed"
+    assert second.metadata["error"] == "API request failed"
+    assert len(calls) == 2
+    assert not evaluation_service._response_cache
+
+
+def test_successful_response_is_cached(evaluation_service, monkeypatch):
+    calls = _stub_call_llm(monkeypatch, {"match_level": 5, "justification": "Identical.", "metadata": {}})
+
+    first = _evaluate(evaluation_service)
+    second = _evaluate(evaluation_service)
+
+    assert first.match_level == second.match_level == 5
+    assert len(calls) == 1
+    assert len(evaluation_service._response_cache) == 1
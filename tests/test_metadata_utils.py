@@ -0,0 +1,25 @@
+"""Tests for metadata value matching in level_core.evaluators.utils."""
+import pytest
+
+from level_core.evaluators import utils
+
+
+def test_builtin_types_match_with_default_parsers():
+    assert utils.compare_values("float", "12.5", 12.5000001) == 1.0
+    assert utils.compare_values("date", "01/02/2024", "01-02-2024") == 1.0
+    assert utils.compare_values("string", " Paris ", "paris") == 1.0
+
+
+def test_replaced_string_parser_is_honored(monkeypatch):
+    monkeypatch.setitem(utils.FIELD_PARSERS, "string", lambda val: str(val).replace("-", "").lower())
+
+    assert utils.compare_values("string", "AB-12", "ab12") == 1.0
+    # Unknown types fall back to the (replaced) string parser
+    assert utils.evaluate_metadata({"ref": "AB-12"}, {"ref": "ab12"}, {"ref": "reference"}) == 1.0
+
+
+def test_replaced_float_parser_keeps_tolerance(monkeypatch):
+    monkeypatch.setitem(utils.FIELD_PARSERS, "float", lambda val: utils.parse_float(str(val).replace(",", ".")))
+
+    assert utils.compare_values("float", "12,5", 12.5000001) == 1.0
+    assert utils.compare_values("float", "12,5", 13) == pytest.approx(utils.levenshtein_f1("12,5", "13"))
@@ -0,0 +1,112 @@
+"""Tests for the token-bucket rate limiter in front of provider calls."""
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+from level_core.evaluators import base as base_module
+from level_core.evaluators import rate_limiter as rate_limiter_module
+from level_core.evaluators.ionos import IonosEvaluator
+from level_core.evaluators.rate_limiter import TokenBucket, estimate_tokens
+from level_core.evaluators.schemas import EvaluationConfig
+
+
+class _FakeClock:
+    """Stands in for time.monotonic / asyncio.sleep so waits advance virtual time instantly."""
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(rate_limiter_module, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=fake.sleep))
+    return fake
+
+
+def test_estimate_tokens_counts_about_four_characters_per_token():
+    assert estimate_tokens("a" * 40, None, "b" * 20) == 15
+    assert estimate_tokens(None, "") == 0
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucket(requests_per_minute=60)
+
+    async def drain():
+        for _ in range(60):
+            await bucket.acquire()
+
+    asyncio.run(drain())
+    assert clock.sleeps == []
+    assert bucket.request_tokens == pytest.approx(0)
+
+    clock.now += 30
+    bucket._refill()
+    assert bucket.request_tokens == pytest.approx(30)
+
+    # Refill is capped at the bucket capacity
+    clock.now += 600
+    bucket._refill()
+    assert bucket.request_tokens == pytest.approx(60)
+
+
+def test_acquire_blocks_when_requests_are_exhausted(clock):
+    bucket = TokenBucket(requests_per_minute=6)
+
+    async def acquire_seven():
+        for _ in range(7):
+            await bucket.acquire()
+
+    asyncio.run(acquire_seven())
+    # 6 RPM refills one request every 10 seconds
+    assert clock.sleeps == [pytest.approx(10)]
+
+
+def test_acquire_blocks_on_estimated_tokens(clock):
+    bucket = TokenBucket(tokens_per_minute=600)
+    prompt = "x" * 2000  # ~500 tokens
+
+    async def acquire_twice():
+        await bucket.acquire(estimate_tokens(prompt))
+        await bucket.acquire(estimate_tokens(prompt))
+
+    asyncio.run(acquire_twice())
+    # 100 tokens left after the first call; the missing 400 refill at 10 tokens per second
+    assert clock.sleeps == [pytest.approx(40)]
+
+
+def test_every_retry_attempt_takes_from_the_bucket(monkeypatch):
+    monkeypatch.setattr(base_module, "_RETRY_POLICY", base_module._RETRY_POLICY.copy(wait=wait_none()))
+    attempts = []
+
+    async def call_llm(self, prompt):
+        attempts.append(prompt)
+        if len(attempts) < 3:
+            request = httpx.Request("POST", "http://ionos.test")
+            raise httpx.HTTPStatusError("rate limited", request=request, response=httpx.Response(429, request=request))
+        return {"match_level": 4, "justification": "Close.", "metadata": {}}
+
+    monkeypatch.setattr(IonosEvaluator, "call_llm", call_llm)
+    evaluator = IonosEvaluator(
+        EvaluationConfig(api_url="http://ionos.test", api_key="test-key", model_id="test-model"),
+        logging.getLogger("test-rate-limiter"),
+    )
+    bucket = TokenBucket(requests_per_minute=100)
+
+    result = asyncio.run(evaluator.evaluate("generated", "expected", rate_limiter=bucket))
+
+    assert result.match_level == 4
+    assert len(attempts) == 3
+    assert bucket.request_tokens == pytest.approx(97, abs=0.1)